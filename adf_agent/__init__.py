@@ -4,9 +4,7 @@ ADF Agent - Azure Data Factory 助手
 使用 LangChain 构建的 Agent，帮助探索和管理 Azure Data Factory 资源。
 """
 
-from .agent import ADFAgent, create_adf_agent, check_api_credentials
-from .context import ADFAgentContext, ADFConfig
-from .tools import ALL_TOOLS
+from importlib import import_module
 
 __version__ = "0.1.0"
 
@@ -18,3 +16,22 @@ __all__ = [
     "ADFConfig",
     "ALL_TOOLS",
 ]
+
+# 按需导入：避免 `import adf_agent.cli` 时就加载 LangChain / Azure SDK
+_LAZY_EXPORTS = {
+    "ADFAgent": ".agent",
+    "create_adf_agent": ".agent",
+    "check_api_credentials": ".agent",
+    "ADFAgentContext": ".context",
+    "ADFConfig": ".context",
+    "ALL_TOOLS": ".tools",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,80 @@
+"""
+JSON codec shared by the formatter, the ADF client and the exec_python runtime
+
+Uses orjson when it is installed (the "fast" extra) and the stdlib json module
+otherwise. Anything orjson would encode differently from json.dumps (datetimes,
+dataclasses, str/int/dict/list subclasses, non-str keys, integers beyond 64
+bits) is handed to the stdlib encoder, so the accepted input and the raised
+TypeError are the same either way. Known remaining differences under orjson:
+enum.Enum and uuid.UUID values are encoded instead of rejected, and
+NaN/Infinity are written as null.
+
+Stdlib-only imports: exec_python deploys this file next to _exec_runtime.py
+and imports it as a top-level module.
+"""
+
+import json
+import re
+from typing import Any, Callable, Optional
+
+try:
+    import orjson  # optional C JSON codec
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # Route every non-native type to _fallback, i.e. to the stdlib encoder
+    _OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+
+# A digit run this long may be an integer outside the 64-bit range, which
+# orjson.loads would silently turn into a float
+_WIDE_INT_RE = re.compile(r"-\d{19}|\d{20}")
+_WIDE_INT_RE_B = re.compile(rb"-\d{19}|\d{20}")
+
+
+def _fallback(obj: Any) -> Any:
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: str | bytes) -> Any:
+    """json.loads, via orjson when available"""
+    wide_int_re = _WIDE_INT_RE_B if isinstance(data, bytes) else _WIDE_INT_RE
+    if orjson is not None and wide_int_re.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity, which the stdlib parser accepts
+    return json.loads(data)
+
+
+def dumps_indented(data: Any) -> str:
+    """json.dumps(data, indent=2, ensure_ascii=False), via orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, default=_fallback, option=_OPTIONS | orjson.OPT_INDENT_2
+            ).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def dumps(data: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Compact UTF-8 JSON bytes, via orjson when available
+
+    Same output as json.dumps(data, ensure_ascii=False, separators=(",", ":"),
+    default=default).encode("utf-8").
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=_fallback, option=_OPTIONS)
+        except TypeError:
+            pass
+    return json.dumps(
+        data, ensure_ascii=False, separators=(",", ":"), default=default
+    ).encode("utf-8")
@@ -20,7 +20,8 @@ from .context import ADFAgentContext, ADFConfig
 from .skill_loader import SkillLoader
 from .tools import ALL_TOOLS
 from .prompts import build_system_prompt
-from .stream import StreamEventEmitter, ToolCallTracker, TokenTracker, is_success, DisplayLimits
+from .observability import wait_for_mlflow_tracking
+from .stream import StreamEvent, StreamEventEmitter, coalesce_deltas, ToolCallTracker, TokenTracker, is_success, DisplayLimits
 
 
 # Load environment variables (override=True ensures .env overrides system env vars)
@@ -270,6 +271,7 @@ class ADFAgent:
             Agent response
         """
         config = {"configurable": {"thread_id": thread_id}}
+        wait_for_mlflow_tracking()
 
         result = self.agent.invoke(
             {"messages": [{"role": "user", "content": message}]},
@@ -291,6 +293,7 @@ class ADFAgent:
             Streaming response chunks (full state updates)
         """
         config = {"configurable": {"thread_id": thread_id}}
+        wait_for_mlflow_tracking()
 
         for chunk in self.agent.stream(
             {"messages": [{"role": "user", "content": message}]},
@@ -300,7 +303,7 @@ class ADFAgent:
         ):
             yield chunk
 
-    def stream_events(self, message: str, thread_id: str = "default") -> Iterator[dict]:
+    def stream_events(self, message: str, thread_id: str = "default") -> Iterator[StreamEvent]:
         """
         Event-level streaming output, supporting thinking and token-level streaming
 
@@ -309,14 +312,23 @@ class ADFAgent:
             thread_id: Session ID
 
         Yields:
-            Event dicts in the following format:
-            - {"type": "thinking", "content": "..."} - Thinking content fragment
-            - {"type": "text", "content": "..."} - Response text fragment
-            - {"type": "tool_call", "name": "...", "args": {...}} - Tool call
-            - {"type": "tool_result", "name": "...", "content": "...", "success": bool} - Tool result
-            - {"type": "done", "response": "..."} - Completion marker with full response
+            StreamEvent objects; event.type selects the payload in event.data:
+            - "thinking": {"content": "..."} - Thinking content fragment
+            - "text": {"content": "..."} - Response text fragment
+            - "tool_call": {"name": "...", "args": {...}} - Tool call
+            - "tool_result": {"name": "...", "content": "...", "success": bool} - Tool result
+            - "token_usage": {"input_tokens": int, "output_tokens": int, ...} - Token usage
+            - "done": {"response": "..."} - Completion marker with full response
+
+            Consecutive text/thinking fragments are merged (see coalesce_deltas),
+            so one event may carry several token deltas.
         """
+        return coalesce_deltas(self._iter_stream_events(message, thread_id))
+
+    def _iter_stream_events(self, message: str, thread_id: str) -> Iterator[StreamEvent]:
+        """Per-delta event stream behind stream_events()"""
         config = {"configurable": {"thread_id": thread_id}}
+        wait_for_mlflow_tracking()
         emitter = StreamEventEmitter()
         tracker = ToolCallTracker()
         token_tracker = TokenTracker()
@@ -344,7 +356,7 @@ class ADFAgent:
                     cache_read_input_tokens=pending_turn_usage.cache_read_input_tokens,
                     is_total=False,
                     parallel_count=parallel_count,
-                ).data
+                )
                 pending_turn_usage = None
                 parallel_count = 0
                 return ev
@@ -386,14 +398,14 @@ class ADFAgent:
                             full_response += ev.data.get("content", "")
                         if debug:
                             print(f"[DEBUG] Yielding: {ev.type}")
-                        yield ev.data
+                        yield ev
 
                     # Handle tool_calls (sometimes in chunk.tool_calls)
                     if hasattr(chunk, "tool_calls") and chunk.tool_calls:
                         for ev in self._process_tool_calls(chunk.tool_calls, emitter, tracker):
                             if debug:
                                 print(f"[DEBUG] Yielding from tool_calls: {ev.type}")
-                            yield ev.data
+                            yield ev
 
                 # Handle ToolMessage (tool execution result)
                 elif hasattr(chunk, "type") and chunk.type == "tool":
@@ -407,7 +419,7 @@ class ADFAgent:
                     for ev in self._process_tool_result(chunk, emitter, tracker):
                         if debug:
                             print(f"[DEBUG] Yielding: {ev.type}")
-                        yield ev.data
+                        yield ev
 
                     # Buffer token_usage, send when batch ends
                     if turn_usage and not turn_usage.is_empty():
@@ -427,7 +439,7 @@ class ADFAgent:
                 print(f"[DEBUG] Stream error: {e}")
                 traceback.print_exc()
             # Send error event to notify the user
-            yield emitter.error(str(e)).data
+            yield emitter.error(str(e))
             raise
 
         # Send buffered per-turn token_usage from previous batch
@@ -446,7 +458,7 @@ class ADFAgent:
                 cache_read_input_tokens=last_turn.cache_read_input_tokens,
                 is_total=False,
                 parallel_count=1,
-            ).data
+            )
 
         # Send aggregate token usage (SUM of all turns)
         usage = token_tracker.get_usage()
@@ -458,10 +470,10 @@ class ADFAgent:
                 cache_creation_input_tokens=usage.cache_creation_input_tokens,
                 cache_read_input_tokens=usage.cache_read_input_tokens,
                 is_total=True,
-            ).data
+            )
 
         # Send completion event
-        yield emitter.done(full_response).data
+        yield emitter.done(full_response)
 
     def _process_chunk_content(self, chunk, emitter: StreamEventEmitter, tracker: ToolCallTracker):
         """Process chunk content"""
@@ -13,20 +13,20 @@ class ChatAzureFoundryClaude(ChatAnthropic):
         kwargs.setdefault("cache_control", {"type": "ephemeral"})
         return super()._get_request_payload(input_, stop=stop, **kwargs)
 
+    @cached_property
+    def _auth_kwargs(self) -> dict:
+        """Client construction kwargs, shared so the secret is read once."""
+        return {
+            "api_key": self.anthropic_api_key.get_secret_value(),
+            "base_url": self.anthropic_api_url,
+            "max_retries": self.max_retries,
+            "timeout": self.default_request_timeout,
+        }
+
     @cached_property
     def _client(self) -> AnthropicFoundry:
-        return AnthropicFoundry(
-            api_key=self.anthropic_api_key.get_secret_value(),
-            base_url=self.anthropic_api_url,
-            max_retries=self.max_retries,
-            timeout=self.default_request_timeout,
-        )
+        return AnthropicFoundry(**self._auth_kwargs)
 
     @cached_property
     def _async_client(self) -> AsyncAnthropicFoundry:
-        return AsyncAnthropicFoundry(
-            api_key=self.anthropic_api_key.get_secret_value(),
-            base_url=self.anthropic_api_url,
-            max_retries=self.max_retries,
-            timeout=self.default_request_timeout,
-        )
+        return AsyncAnthropicFoundry(**self._auth_kwargs)
@@ -8,17 +8,20 @@ Command-line entry point providing interactive conversation:
 """
 
 import argparse
+import io
 import json
 import os
 import shutil
+import signal
 import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
 from dotenv import load_dotenv
-from prompt_toolkit import PromptSession
-from prompt_toolkit.history import FileHistory
-from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
-from prompt_toolkit.formatted_text import HTML
 from rich.console import Console, Group
 from rich.panel import Panel
 from rich.markdown import Markdown
@@ -27,9 +30,8 @@ from rich.live import Live
 from rich.text import Text
 from rich.spinner import Spinner
 
-from .agent import ADFAgent
-from .context import _use_workspace, ADFConfig
 from .stream import (
+    StreamEvent,
     ToolResultFormatter,
     has_args,
     DisplayLimits,
@@ -37,19 +39,20 @@ from .stream import (
     format_tool_compact,
     is_success,
 )
+from .observability import start_mlflow_tracking
 
-
-# Load environment variables
-load_dotenv(override=True)
-
-# MLflow tracking
-from .observability import setup_mlflow_tracking
-setup_mlflow_tracking()
+# The agent (LangChain, Azure SDK) and prompt_toolkit are imported where they
+# are first needed, so `adf_agent --help` and onboarding start quickly
+if TYPE_CHECKING:
+    from .agent import ADFAgent
 
 # Rich Console configuration
+# Output is either pre-styled Text/markup or Markdown, so the repr highlighter
+# (a regex pass over every printed string) is disabled.
 console = Console(
     legacy_windows=(sys.platform == 'win32'),
     no_color=os.getenv('NO_COLOR') is not None,
+    highlight=False,
 )
 
 # Global tool result formatter
@@ -58,7 +61,79 @@ formatter = ToolResultFormatter()
 
 # === Terminal height calculation ===
 
+# Cached terminal size [columns, lines], refreshed on SIGWINCH once main()
+# installs the handler, otherwise at most once per second (e.g. on Windows)
+_TERM_SIZE_TTL = 1.0
+_term_size = list(shutil.get_terminal_size())
+_term_size_ts = time.monotonic()
+_HAS_SIGWINCH = False
+
+
+def _refresh_terminal_size(*_) -> None:
+    """Re-query terminal size into the module-level cache"""
+    global _term_size_ts
+    _term_size[:] = shutil.get_terminal_size()
+    _term_size_ts = time.monotonic()
+
+
+def _install_resize_handler() -> None:
+    """Refresh the cached terminal size on SIGWINCH, where the platform has it"""
+    global _HAS_SIGWINCH
+    if hasattr(signal, "SIGWINCH"):
+        signal.signal(signal.SIGWINCH, _refresh_terminal_size)
+        _HAS_SIGWINCH = True
+
+
+def get_cached_terminal_height() -> int:
+    """Get terminal height without a per-frame terminal size query"""
+    if not _HAS_SIGWINCH and time.monotonic() - _term_size_ts >= _TERM_SIZE_TTL:
+        _refresh_terminal_size()
+    return _term_size[1] or 25
+
+
+class HeightBudget(NamedTuple):
+    """Content line counts allocated to each streaming display region"""
+    thinking: int
+    response: int
+    lines_per_tool: int
+
+
+def _alloc_response_thinking_tools(budget: int) -> tuple[int, int, int]:
+    response_h = max(3, budget // 2)
+    rest = budget - response_h
+    thinking_h = max(2, rest // 3)
+    return thinking_h, response_h, rest - thinking_h
+
+
+def _alloc_response_thinking(budget: int) -> tuple[int, int, int]:
+    response_h = max(3, budget * 2 // 3)
+    return max(2, budget - response_h), response_h, 0
+
+
+def _alloc_response_tools(budget: int) -> tuple[int, int, int]:
+    response_h = max(3, budget * 3 // 5)
+    return 0, response_h, budget - response_h
+
+
+def _alloc_thinking_tools(budget: int) -> tuple[int, int, int]:
+    thinking_h = max(3, budget * 2 // 5)
+    return thinking_h, 0, budget - thinking_h
+
+
+# (has_response, has_thinking, has_results) -> budget -> (thinking, response, tool results)
+_ALLOC_TABLE = {
+    (True, True, True): _alloc_response_thinking_tools,
+    (True, True, False): _alloc_response_thinking,
+    (True, False, True): _alloc_response_tools,
+    (True, False, False): lambda budget: (0, budget, 0),
+    (False, True, True): _alloc_thinking_tools,
+    (False, True, False): lambda budget: (budget, 0, 0),
+    (False, False, True): lambda budget: (0, 0, budget),
+    (False, False, False): lambda budget: (0, 0, 0),
+}
 
+
+@lru_cache(maxsize=256)
 def compute_height_budget(
     terminal_height: int,
     has_thinking: bool,
@@ -67,7 +142,7 @@ def compute_height_budget(
     num_tools: int,
     num_results: int,
     show_processing: bool,
-) -> dict:
+) -> HeightBudget:
     """Dynamically allocate content line counts for each region based on
     terminal height and currently active regions.
 
@@ -75,8 +150,11 @@ def compute_height_budget(
     overhead) fit within terminal_height.
     Allocation priority: response > tools > thinking.
 
+    The function is pure and called every frame with a small set of distinct
+    inputs, so results are memoized.
+
     Returns:
-        {"thinking": int, "response": int, "lines_per_tool": int}
+        HeightBudget(thinking, response, lines_per_tool)
     """
     num_pending = max(0, num_tools - num_results)
 
@@ -97,31 +175,8 @@ def compute_height_budget(
     content_budget = max(6, terminal_height - fixed)
 
     # Allocate by priority: response > tools > thinking
-    thinking_h = 0
-    tool_result_budget = 0
-    response_h = 0
-
-    if has_response:
-        if has_thinking and num_results > 0:
-            response_h = max(3, content_budget // 2)
-            rest = content_budget - response_h
-            thinking_h = max(2, rest // 3)
-            tool_result_budget = rest - thinking_h
-        elif has_thinking:
-            response_h = max(3, content_budget * 2 // 3)
-            thinking_h = max(2, content_budget - response_h)
-        elif num_results > 0:
-            response_h = max(3, content_budget * 3 // 5)
-            tool_result_budget = content_budget - response_h
-        else:
-            response_h = content_budget
-    elif has_thinking and num_results > 0:
-        thinking_h = max(3, content_budget * 2 // 5)
-        tool_result_budget = content_budget - thinking_h
-    elif has_thinking:
-        thinking_h = content_budget
-    elif num_results > 0:
-        tool_result_budget = content_budget
+    alloc = _ALLOC_TABLE[(has_response, has_thinking, num_results > 0)]
+    thinking_h, response_h, tool_result_budget = alloc(content_budget)
 
     # Display lines per tool result (-1 to reserve a line for token usage)
     if num_results > 0 and tool_result_budget > 0:
@@ -129,30 +184,65 @@ def compute_height_budget(
     else:
         lines_per_tool = 2
 
-    return {
-        "thinking": thinking_h,
-        "response": response_h,
-        "lines_per_tool": lines_per_tool,
-    }
+    return HeightBudget(
+        thinking=thinking_h,
+        response=response_h,
+        lines_per_tool=lines_per_tool,
+    )
 
 
 def truncate_to_lines(text: str, max_lines: int) -> str:
-    """Truncate text to a given number of lines, keeping the most recent content"""
-    lines = text.split('\n')
-    if len(lines) <= max_lines:
-        return text
-    return "...\n" + '\n'.join(lines[-max_lines + 1:])
+    """Truncate text to a given number of lines, keeping the most recent content
+
+    Scans backward for newlines instead of splitting the whole buffer, so the
+    cost follows the visible tail rather than the full streamed text.
+    """
+    keep = max(1, max_lines - 1)  # Lines kept below the "..." marker
+    pos = len(text)
+    cut = 0
+    for found in range(1, max(1, max_lines) + 1):
+        nl = text.rfind('\n', 0, pos)
+        if nl < 0:
+            return text  # Fits within max_lines
+        if found == keep:
+            cut = nl + 1
+        pos = nl
+    return "...\n" + text[cut:]
 
 
 # === Streaming state ===
 
+@dataclass(slots=True)
+class ToolCall:
+    """Tool call record for display"""
+    id: str
+    name: str
+    args: dict
+    compact: str = ""  # Precomputed format_tool_compact() label
+
+
+@dataclass(slots=True)
+class ToolResult:
+    """Tool result record for display"""
+    name: str
+    content: str
+    ok: bool | None = None  # Precomputed is_success() verdict
+    elements_cache: tuple | None = None  # ((len(content), max_lines), lines)
+    usage_text_cache: tuple | None = None  # (turn usage dict, formatted Text)
+
+
 class StreamState:
     """Streaming state container"""
 
     def __init__(self):
-        self.thinking_text = ""
-        self.response_text = ""
+        # Text arrives one token at a time; keep chunks and join lazily on read.
+        # Memos are (chunk count, joined text), invalidated when a chunk is appended.
+        self._thinking_chunks: list[str] = []
+        self._response_chunks: list[str] = []
+        self._thinking_memo: tuple[int, str] = (0, "")
+        self._response_memo: tuple[int, str] = (0, "")
         self.tool_calls = []
+        self._tool_index = {}  # tool_id -> position in tool_calls
         self.tool_results = []
         self.is_thinking = False
         self.is_responding = False
@@ -160,69 +250,84 @@ class StreamState:
         self.token_usage = None  # TokenUsageInfo dict (total)
         self.turn_token_usages = []  # Per-turn token usages (aligned with tool_results)
 
-    def handle_event(self, event: dict) -> str:
+    @property
+    def thinking_text(self) -> str:
+        """Accumulated thinking text"""
+        n = len(self._thinking_chunks)
+        if self._thinking_memo[0] != n:
+            self._thinking_memo = (n, "".join(self._thinking_chunks))
+        return self._thinking_memo[1]
+
+    @property
+    def response_text(self) -> str:
+        """Accumulated response text"""
+        n = len(self._response_chunks)
+        if self._response_memo[0] != n:
+            self._response_memo = (n, "".join(self._response_chunks))
+        return self._response_memo[1]
+
+    def handle_event(self, event: StreamEvent) -> str:
         """Handle a single streaming event"""
-        event_type = event.get("type")
+        event_type = event.type
+        data = event.data
 
         if event_type == "thinking":
             self.is_thinking = True
             self.is_responding = False
             self.is_processing = False
-            self.thinking_text += event.get("content", "")
+            self._thinking_chunks.append(data.get("content", ""))
 
         elif event_type == "text":
             self.is_thinking = False
             self.is_responding = True
             self.is_processing = False
-            self.response_text += event.get("content", "")
+            self._response_chunks.append(data.get("content", ""))
 
         elif event_type == "tool_call":
             self.is_thinking = False
             self.is_responding = False
             self.is_processing = False
 
-            tool_id = event.get("id", "")
-            tc_data = {
-                "id": tool_id,
-                "name": event.get("name", "unknown"),
-                "args": event.get("args", {}),
-            }
+            tool_id = data.get("id", "")
+            name = data.get("name", "unknown")
+            args = data.get("args", {})
+            # Args are fixed per event; format once instead of every frame
+            tc_data = ToolCall(tool_id, name, args, format_tool_compact(name, args))
 
             # Deduplicate and update by tool_id
-            if tool_id:
-                updated = False
-                for i, tc in enumerate(self.tool_calls):
-                    if tc.get("id") == tool_id:
-                        self.tool_calls[i] = tc_data
-                        updated = True
-                        break
-                if not updated:
-                    self.tool_calls.append(tc_data)
+            idx = self._tool_index.get(tool_id) if tool_id else None
+            if idx is not None:
+                self.tool_calls[idx] = tc_data
             else:
+                if tool_id:
+                    self._tool_index[tool_id] = len(self.tool_calls)
                 self.tool_calls.append(tc_data)
 
         elif event_type == "tool_result":
             self.is_processing = True
-            self.tool_results.append({
-                "name": event.get("name", "unknown"),
-                "content": event.get("content", ""),
-            })
+            content = data.get("content", "")
+            self.tool_results.append(ToolResult(
+                name=data.get("name", "unknown"),
+                content=content,
+                ok=is_success(content),
+            ))
 
         elif event_type == "done":
             self.is_processing = False
+            reset_display_cache()
             if not self.response_text:
-                self.response_text = event.get("response", "")
+                self._response_chunks.append(data.get("response", ""))
 
         elif event_type == "token_usage":
             usage = {
-                "input_tokens": event.get("input_tokens", 0),
-                "output_tokens": event.get("output_tokens", 0),
-                "total_tokens": event.get("total_tokens", 0),
-                "cache_creation_input_tokens": event.get("cache_creation_input_tokens", 0),
-                "cache_read_input_tokens": event.get("cache_read_input_tokens", 0),
+                "input_tokens": data.get("input_tokens", 0),
+                "output_tokens": data.get("output_tokens", 0),
+                "total_tokens": data.get("total_tokens", 0),
+                "cache_creation_input_tokens": data.get("cache_creation_input_tokens", 0),
+                "cache_read_input_tokens": data.get("cache_read_input_tokens", 0),
             }
-            is_total = event.get("is_total", False)
-            parallel_count = event.get("parallel_count", 1)
+            is_total = data.get("is_total", False)
+            parallel_count = data.get("parallel_count", 1)
             if is_total:
                 # Aggregate (SUM of all API calls)
                 self.token_usage = usage
@@ -240,8 +345,8 @@ class StreamState:
             self.is_processing = False
             self.is_thinking = False
             self.is_responding = False
-            error_msg = event.get("message", "Unknown error")
-            self.response_text += f"\n\n[Error] {error_msg}"
+            error_msg = data.get("message", "Unknown error")
+            self._response_chunks.append(f"\n\n[Error] {error_msg}")
 
         return event_type
 
@@ -259,6 +364,80 @@ class StreamState:
         }
 
 
+class StreamingView:
+    """Live renderable that builds the streaming display from StreamState on demand
+
+    Live's low-rate auto refresh renders it too, so spinners keep animating
+    while no events arrive (tool runs, network waits) and a delta dropped
+    by ShouldRender is painted on the next tick instead of the next event.
+    """
+
+    REFRESH_PER_SECOND = 4
+
+    def __init__(self, state: "StreamState"):
+        self.state = state
+        self.waiting = True  # Until the first event arrives
+
+    def __rich_console__(self, console, options):
+        if self.waiting:
+            yield create_streaming_display(is_waiting=True)
+        else:
+            yield create_streaming_display(
+                **self.state.get_display_args(),
+                terminal_height=get_cached_terminal_height(),
+            )
+
+
+class ShouldRender:
+    """Render throttle for the streaming Live display
+
+    State is updated on every event, but rebuilding the display re-parses the
+    response Markdown, so frames are coalesced to at most one per interval.
+    Event type transitions (thinking -> tool_call -> responding) and
+    tool/terminal events always render immediately.
+    """
+
+    INTERVAL = 0.1  # Seconds between coalesced frames (~10 Hz)
+    ALWAYS_RENDER = frozenset({"tool_call", "tool_result", "done"})
+
+    def __init__(self, interval: float = INTERVAL):
+        self.interval = interval
+        self.last_render_ts = 0.0
+        self.last_event_type = None
+
+    def __call__(self, event_type: str) -> bool:
+        """Return True if the display should be rebuilt for this event"""
+        now = time.monotonic()
+        if (
+            event_type in self.ALWAYS_RENDER
+            or event_type != self.last_event_type
+            or now - self.last_render_ts >= self.interval
+        ):
+            self.last_render_ts = now
+            self.last_event_type = event_type
+            return True
+        return False
+
+
+# Token usage separator, rendered once with the console's color settings
+_SEPARATOR = "─" * 40
+_separator_ansi: str | None = None
+
+
+def _print_separator() -> None:
+    """Print the dim separator line, reusing its pre-rendered output"""
+    global _separator_ansi
+    if console.legacy_windows:
+        # Legacy Windows consoles are styled via the win32 API, not ANSI
+        console.print(_SEPARATOR, style="dim")
+        return
+    if _separator_ansi is None:
+        with console.capture() as capture:
+            console.print(_SEPARATOR, style="dim")
+        _separator_ansi = capture.get()
+    console.file.write(_separator_ansi)
+
+
 def display_token_usage(token_usage: dict) -> None:
     """Display aggregate token usage
 
@@ -286,7 +465,7 @@ def display_token_usage(token_usage: dict) -> None:
         return f"{n:,}"
 
     # Separator and token info
-    console.print("─" * 40, style="dim")
+    _print_separator()
 
     cached_total = cache_read + cache_creation
     if cached_total > 0:
@@ -358,41 +537,82 @@ def format_turn_token_usage(token_usage: dict | None) -> Text | None:
     return Text(base, style="dim")
 
 
-def format_tool_result_compact(
-    name: str,
-    content: str,
-    max_lines: int = 5,
-    token_usage: dict | None = None,
-) -> list:
-    """Display tool results in tree format"""
+def _format_result_lines(content: str, max_lines: int, success: bool | None) -> list:
+    """Build the tree-format Text lines for a tool result"""
     elements = []
 
-    if not content.strip():
+    stripped = content.strip()
+    if not stripped:
         elements.append(Text("  └ (empty)", style="dim"))
     else:
-        lines = content.strip().split("\n")
-        total_lines = len(lines)
-        display_lines = lines[:max_lines]
+        # Only split off the lines that are displayed; count the rest
+        total_lines = stripped.count("\n") + 1
+        display_lines = stripped.split("\n", max_lines)[:max_lines]
 
+        if success is None:
+            success = is_success(content)
+        style = "dim" if success else "red dim"
         for i, line in enumerate(display_lines):
             prefix = "└" if i == 0 else " "
             if len(line) > 80:
                 line = line[:77] + "..."
-            style = "dim" if is_success(content) else "red dim"
             elements.append(Text(f"  {prefix} {line}", style=style))
 
         remaining = total_lines - max_lines
         if remaining > 0:
             elements.append(Text(f"    ... +{remaining} lines", style="dim italic"))
 
+    return elements
+
+
+def format_tool_result_compact(
+    name: str,
+    content: str,
+    max_lines: int = 5,
+    token_usage: dict | None = None,
+    success: bool | None = None,
+    cache: ToolResult | None = None,
+) -> list:
+    """Display tool results in tree format
+
+    success may be passed when already known, to skip re-classifying content.
+    cache is an optional ToolResult whose elements_cache keeps the built
+    lines between frames; they are rebuilt only when the content length or
+    max_lines changes, and its usage_text_cache keeps the token usage line
+    for as long as the same usage entry is passed in.
+    """
+    key = (len(content), max_lines)
+    cached = cache.elements_cache if cache is not None else None
+    if cached is not None and cached[0] == key:
+        elements = list(cached[1])
+    else:
+        elements = _format_result_lines(content, max_lines, success)
+        if cache is not None:
+            cache.elements_cache = (key, tuple(elements))
+
     # Add token usage display (below the result)
-    token_text = format_turn_token_usage(token_usage)
+    memo = cache.usage_text_cache if cache is not None else None
+    if memo is not None and memo[0] is token_usage:
+        token_text = memo[1]
+    else:
+        token_text = format_turn_token_usage(token_usage)
+        if cache is not None:
+            cache.usage_text_cache = (token_usage, token_text)
     if token_text:
         elements.append(token_text)
 
     return elements
 
 
+# Tool row status prefix and style, keyed by result verdict (None = no result yet)
+_STATUS_STYLE = {
+    True: (f"{ToolStatus.SUCCESS.value} ", "bold green"),
+    False: (f"{ToolStatus.ERROR.value} ", "bold red"),
+    None: (f"{ToolStatus.RUNNING.value} ", "bold yellow"),
+}
+_FINAL_STATUS_STYLE = {**_STATUS_STYLE, None: (f"{ToolStatus.PENDING.value} ", "dim")}
+
+
 def display_final_results(
     state: StreamState,
     thinking_max_length: int = DisplayLimits.THINKING_FINAL,
@@ -416,38 +636,28 @@ def display_final_results(
 
     # Display tool calls and results
     if show_tools and state.tool_calls:
+        # Collect all rows and print once (one layout/render/flush per turn)
+        final_lines = []
         for i, tc in enumerate(state.tool_calls):
             has_result = i < len(state.tool_results)
             tr = state.tool_results[i] if has_result else None
-            content = tr.get('content', '') if tr else ''
+            content = tr.content if tr else ''
             # Get this turn's token usage
             turn_tokens = state.turn_token_usages[i] if i < len(state.turn_token_usages) else None
 
-            if has_result and is_success(content):
-                status = ToolStatus.SUCCESS
-                style = "bold green"
-            elif has_result:
-                status = ToolStatus.ERROR
-                style = "bold red"
-            else:
-                status = ToolStatus.PENDING
-                style = "dim"
-
-            tool_compact = format_tool_compact(tc['name'], tc.get('args'))
-            tool_text = Text()
-            tool_text.append(f"{status.value} ", style=style)
-            tool_text.append(tool_compact, style=style)
-            console.print(tool_text)
+            prefix, style = _FINAL_STATUS_STYLE[tr.ok if has_result else None]
+            final_lines.append(Text.assemble((prefix, style), (tc.compact, style)))
 
             if has_result:
                 result_elements = format_tool_result_compact(
-                    tr['name'],
+                    tr.name,
                     content,
                     max_lines=10,
                     token_usage=turn_tokens,
+                    success=tr.ok,
                 )
-                for elem in result_elements:
-                    console.print(elem)
+                final_lines.extend(result_elements)
+        console.print(Group(*final_lines))
         console.print()
 
     # Display final response
@@ -467,6 +677,38 @@ def display_final_results(
     display_token_usage(state.token_usage)
 
 
+# Spinners only track their start time, so one instance per message is reused
+_SPIN_THINK = Spinner("dots", text=" AI is thinking...", style="cyan")
+_SPIN_EXEC = Spinner("dots", text=" Executing...", style="yellow")
+_SPIN_ANALYZE = Spinner("dots", text=" AI is analyzing results...", style="cyan")
+
+# Parsed Markdown for recently displayed response tails (bounded, FIFO eviction)
+_MD_CACHE_SIZE = 4
+_md_cache: dict[str, Markdown] = {}
+
+
+def _cached_markdown(text: str) -> Markdown:
+    """Get a Markdown renderable for text, parsing only on a cache miss"""
+    md = _md_cache.get(text)
+    if md is None:
+        if len(_md_cache) >= _MD_CACHE_SIZE:
+            del _md_cache[next(iter(_md_cache))]
+        md = _md_cache[text] = Markdown(text)
+    return md
+
+
+# Last streaming frame, reused while the state fingerprint is unchanged
+_last_fp = None
+_last_group = None
+
+
+def reset_display_cache() -> None:
+    """Drop the cached streaming frame (called when a turn completes)"""
+    global _last_fp, _last_group
+    _last_fp = None
+    _last_group = None
+
+
 def create_streaming_display(
     thinking_text: str = "",
     response_text: str = "",
@@ -479,17 +721,37 @@ def create_streaming_display(
     is_processing: bool = False,
     terminal_height: int = 25,
 ) -> Group:
-    """Create the streaming display layout, ensuring total height does not exceed terminal height"""
+    """Create the streaming display layout, ensuring total height does not exceed terminal height
+
+    Text buffers are append-only, so a length-based fingerprint identifies
+    the frame; if nothing visible changed the previous Group is returned.
+    """
+    global _last_fp, _last_group
     elements = []
     tool_calls = tool_calls or []
     tool_results = tool_results or []
     turn_token_usages = turn_token_usages or []
 
+    fp = (
+        len(thinking_text),
+        len(response_text),
+        tuple(tc.compact for tc in tool_calls),
+        len(tool_results),
+        len(turn_token_usages),
+        is_thinking,
+        is_responding,
+        is_waiting,
+        is_processing,
+        terminal_height,
+    )
+    if fp == _last_fp:
+        return _last_group
+
     # Initial waiting state
     if is_waiting and not thinking_text and not response_text and not tool_calls:
-        spinner = Spinner("dots", text=" AI is thinking...", style="cyan")
-        elements.append(spinner)
-        return Group(*elements)
+        elements.append(_SPIN_THINK)
+        _last_fp, _last_group = fp, Group(*elements)
+        return _last_group
 
     # === Dynamic height budget ===
     has_thinking = bool(thinking_text)
@@ -508,9 +770,7 @@ def create_streaming_display(
         num_results=len(tool_results),
         show_processing=show_processing,
     )
-    thinking_h = heights["thinking"]
-    response_h = heights["response"]
-    lines_per_tool = heights["lines_per_tool"]
+    thinking_h, response_h, lines_per_tool = heights
 
     # === Build each region ===
 
@@ -520,7 +780,7 @@ def create_streaming_display(
         if is_thinking:
             thinking_title += " ..."
         display_thinking = truncate_to_lines(thinking_text, thinking_h)
-        panel_h = min(len(display_thinking.split('\n')), thinking_h) + 2
+        panel_h = min(display_thinking.count('\n') + 1, thinking_h) + 2
         elements.append(Panel(
             Text(display_thinking, style="dim"),
             title=thinking_title,
@@ -531,45 +791,38 @@ def create_streaming_display(
 
     # Tool Calls display
     if tool_calls:
+        # Local aliases: the loop body runs per tool on every frame
+        assemble = Text.assemble
+        format_result = format_tool_result_compact
+        status_style = _STATUS_STYLE
+        append = elements.append
+        num_results = len(tool_results)
+        num_usages = len(turn_token_usages)
+
         for i, tc in enumerate(tool_calls):
-            has_result = i < len(tool_results)
+            has_result = i < num_results
             tr = tool_results[i] if has_result else None
-            turn_tokens = turn_token_usages[i] if i < len(turn_token_usages) else None
-
-            if has_result:
-                content = tr.get('content', '') if tr else ''
-                if is_success(content):
-                    status = ToolStatus.SUCCESS
-                    style = "bold green"
-                else:
-                    status = ToolStatus.ERROR
-                    style = "bold red"
-            else:
-                status = ToolStatus.RUNNING
-                style = "bold yellow"
+            turn_tokens = turn_token_usages[i] if i < num_usages else None
 
-            tool_compact = format_tool_compact(tc['name'], tc.get('args'))
-            tool_text = Text()
-            tool_text.append(f"{status.value} ", style=style)
-            tool_text.append(tool_compact, style=style)
-            elements.append(tool_text)
+            prefix, style = status_style[tr.ok if has_result else None]
+            append(assemble((prefix, style), (tc.compact, style)))
 
             if has_result:
-                result_elements = format_tool_result_compact(
-                    tr['name'],
-                    tr.get('content', ''),
+                result_elements = format_result(
+                    tr.name,
+                    tr.content,
                     max_lines=lines_per_tool,
                     token_usage=turn_tokens,
+                    success=tr.ok,
+                    cache=tr,
                 )
                 elements.extend(result_elements[:lines_per_tool + 1])  # +1 for token line
             else:
-                spinner = Spinner("dots", text=" Executing...", style="yellow")
-                elements.append(spinner)
+                append(_SPIN_EXEC)
 
     # Post-tool-execution waiting
     if show_processing:
-        spinner = Spinner("dots", text=" AI is analyzing results...", style="cyan")
-        elements.append(spinner)
+        elements.append(_SPIN_ANALYZE)
 
     # Response panel
     if response_text:
@@ -577,9 +830,9 @@ def create_streaming_display(
         if is_responding:
             response_title += " ..."
         display_response = truncate_to_lines(response_text, response_h)
-        panel_h = min(len(display_response.split('\n')), response_h) + 2
+        panel_h = min(display_response.count('\n') + 1, response_h) + 2
         elements.append(Panel(
-            Markdown(display_response),
+            _cached_markdown(display_response),
             title=response_title,
             border_style="green",
             padding=(0, 1),
@@ -588,40 +841,134 @@ def create_streaming_display(
     elif has_response_placeholder:
         elements.append(Text("⏳ Generating response...", style="dim"))
 
-    return Group(*elements) if elements else Text("⏳ Processing...", style="dim")
+    _last_group = Group(*elements) if elements else Text("⏳ Processing...", style="dim")
+    _last_fp = fp
+    return _last_group
 
 
 # === Onboarding ===
 
 def _needs_onboarding() -> bool:
     """Check if onboarding is needed (no API credentials configured)"""
-    has_anthropic = bool(
-        os.getenv("ANTHROPIC_API_KEY") or os.getenv("ANTHROPIC_AUTH_TOKEN")
+    env = os.environ
+    return not (
+        env.get("ANTHROPIC_API_KEY")
+        or env.get("ANTHROPIC_AUTH_TOKEN")
+        or env.get("ANTHROPIC_FOUNDRY_API_KEY")
     )
-    has_foundry = bool(os.getenv("ANTHROPIC_FOUNDRY_API_KEY"))
-    return not has_anthropic and not has_foundry
 
 
-def _read_key() -> str | None:
-    """Read a single keypress, handling arrow key escape sequences"""
+@contextmanager
+def _raw_mode(fd: int):
+    """Put the terminal into raw input mode for the duration of the block
+
+    Output post-processing is kept, so '\n' written while in raw mode still
+    returns the cursor to column 0.
+    """
     import tty, termios
 
-    fd = sys.stdin.fileno()
     old = termios.tcgetattr(fd)
     try:
         tty.setraw(fd)
-        ch = sys.stdin.read(1)
-        if ch == '\x1b':
-            sys.stdin.read(1)  # skip '['
-            arrow = sys.stdin.read(1)
-            return {'A': 'up', 'B': 'down'}.get(arrow)
-        if ch in ('\r', '\n'):
-            return 'enter'
-        if ch == '\x03':
-            raise KeyboardInterrupt
+        mode = termios.tcgetattr(fd)
+        mode[1] = old[1]  # Restore oflag (OPOST/ONLCR)
+        termios.tcsetattr(fd, termios.TCSANOW, mode)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+
+
+@contextmanager
+def _no_echo(fd: int):
+    """Disable terminal echo for the duration of the block (no-op if not a tty)"""
+    if not os.isatty(fd):
+        yield
+        return
+
+    import termios
+
+    old = termios.tcgetattr(fd)
+    try:
+        mode = termios.tcgetattr(fd)
+        mode[3] &= ~termios.ECHO  # lflag
+        termios.tcsetattr(fd, termios.TCSADRAIN, mode)
+        yield
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old)
-    return None
+
+
+def _prompt_line(prompt: str, secret: bool = False) -> str:
+    """Read one line from stdin; with secret=True the typed text is not echoed"""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    if not secret:
+        return sys.stdin.readline().rstrip('\n')
+
+    with _no_echo(sys.stdin.fileno()):
+        line = sys.stdin.readline().rstrip('\n')
+    sys.stdout.write('\n')  # the Enter keypress was not echoed either
+    return line
+
+
+# Bytes read from a raw-mode fd but not yet parsed into keys, kept across
+# _read_key calls so pasted or fast-typed input is not dropped
+_key_buffers: dict[int, bytearray] = {}
+
+# How long to wait for the rest of an escape sequence split across reads
+_ESC_WAIT = 0.05
+
+
+def _fill_key_buffer(fd: int, buf: bytearray, timeout: float | None = None) -> bool:
+    """Append whatever input is available to buf; False on timeout or EOF"""
+    if timeout is not None:
+        import select
+
+        if not select.select([fd], [], [], timeout)[0]:
+            return False
+    data = os.read(fd, 1024)
+    buf += data
+    return bool(data)
+
+
+def _read_key(fd: int) -> str | None:
+    """Read a single keypress, handling arrow key escape sequences
+
+    Expects the terminal to already be in raw mode (see _raw_mode). Input is
+    read in chunks into a per-fd buffer and one key is parsed per call, so an
+    escape sequence split across reads is reassembled and extra keys from a
+    single read are returned by later calls.
+    """
+    buf = _key_buffers.setdefault(fd, bytearray())
+    if not buf and not _fill_key_buffer(fd, buf):
+        raise KeyboardInterrupt  # EOF: no further input to select with
+
+    if buf[0] != 0x1b:
+        byte = buf[0]
+        del buf[0]
+        if byte in (0x0d, 0x0a):
+            return 'enter'
+        if byte == 0x03:
+            raise KeyboardInterrupt
+        return None
+
+    # ESC [ ... final (CSI) or ESC O final (SS3, application cursor mode)
+    while len(buf) < 2 and _fill_key_buffer(fd, buf, _ESC_WAIT):
+        pass
+    if len(buf) < 2 or buf[1] not in b'[O':
+        del buf[0]  # lone Escape
+        return None
+    end = 2
+    while True:
+        while end >= len(buf):
+            if not _fill_key_buffer(fd, buf, _ESC_WAIT):
+                del buf[:end]  # truncated sequence
+                return None
+        if buf[1] == 0x4f or 0x40 <= buf[end] <= 0x7e:
+            break
+        end += 1
+    final = buf[end]
+    del buf[:end + 1]
+    return {0x41: 'up', 0x42: 'down'}.get(final)
 
 
 def _select(title: str, options: list[tuple[str, str]], default: int = 0) -> str | None:
@@ -638,35 +985,47 @@ def _select(title: str, options: list[tuple[str, str]], default: int = 0) -> str
     """
     selected = default
     n = len(options)
-    first = True
+
+    # Labels are fixed; only the highlighted row changes between frames
+    selected_rows = [f"    \033[36m▸ {label}\033[0m" for _, label in options]
+    plain_rows = [f"      {label}" for _, label in options]
+
+    def row(i: int) -> str:
+        return selected_rows[i] if i == selected else plain_rows[i]
 
     def render():
-        nonlocal first
-        if not first:
-            sys.stdout.write(f"\033[{n}A")  # move cursor up
-        first = False
-        for i, (_, label) in enumerate(options):
-            sys.stdout.write('\033[2K')  # clear line
-            if i == selected:
-                sys.stdout.write(f"    \033[36m▸ {label}\033[0m\n")
-            else:
-                sys.stdout.write(f"      {label}\n")
+        """Initial draw of all options; leaves the cursor below the menu"""
+        sys.stdout.write("".join(f"\033[2K{row(i)}\n" for i in range(n)))
+        sys.stdout.flush()
+
+    def repaint(old: int, new: int):
+        """Redraw only the previously and newly selected rows"""
+        if old == new:
+            return
+        step = f"\033[{old - new}A" if new < old else f"\033[{new - old}B"
+        sys.stdout.write(
+            f"\033[{n - old}A\r\033[2K{row(old)}"  # up to old row, draw unselected
+            f"{step}\r\033[2K{row(new)}"          # move to new row, draw selected
+            f"\033[{n - new}B\r"                  # back below the menu
+        )
         sys.stdout.flush()
 
     console.print(f"  [bold]{title}[/bold] [dim](↑↓ select, Enter confirm)[/dim]")
     render()
 
+    fd = sys.stdin.fileno()
     try:
-        while True:
-            key = _read_key()
-            if key == 'up':
-                selected = (selected - 1) % n
-                render()
-            elif key == 'down':
-                selected = (selected + 1) % n
-                render()
-            elif key == 'enter':
-                return options[selected][0]
+        with _raw_mode(fd):
+            while True:
+                key = _read_key(fd)
+                if key == 'up':
+                    prev, selected = selected, (selected - 1) % n
+                    repaint(prev, selected)
+                elif key == 'down':
+                    prev, selected = selected, (selected + 1) % n
+                    repaint(prev, selected)
+                elif key == 'enter':
+                    return options[selected][0]
     except KeyboardInterrupt:
         console.print()
         return None
@@ -674,35 +1033,36 @@ def _select(title: str, options: list[tuple[str, str]], default: int = 0) -> str
 
 def _update_env_file(env_path: Path, updates: dict[str, str]):
     """Update key=value pairs in a .env file, handling duplicate keys"""
-    content = env_path.read_text(encoding="utf-8")
-    lines = content.splitlines()
     updated_keys = set()
-    new_lines = []
+    buf = io.StringIO()
+    write = buf.write
 
-    for line in lines:
-        stripped = line.strip()
+    with env_path.open(encoding="utf-8") as f:
+        for raw in f:
+            line = raw.rstrip('\n')
+            stripped = line.strip()
 
-        if not stripped or stripped.startswith('#'):
-            new_lines.append(line)
-            continue
+            if not stripped or stripped.startswith('#'):
+                write(f"{line}\n")
+                continue
 
-        key = stripped.split('=', 1)[0].strip()
+            key = stripped.split('=', 1)[0].strip()
 
-        if key in updates and key not in updated_keys:
-            new_lines.append(f"{key}={updates[key]}")
-            updated_keys.add(key)
-        elif key in updates:
-            # Duplicate key, comment it out
-            new_lines.append(f"# {line}")
-        else:
-            new_lines.append(line)
+            if key in updates and key not in updated_keys:
+                write(f"{key}={updates[key]}\n")
+                updated_keys.add(key)
+            elif key in updates:
+                # Duplicate key, comment it out
+                write(f"# {line}\n")
+            else:
+                write(f"{line}\n")
 
     # Append keys not found in the file
     for key, value in updates.items():
         if key not in updated_keys:
-            new_lines.append(f"{key}={value}")
+            write(f"{key}={value}\n")
 
-    env_path.write_text('\n'.join(new_lines) + '\n', encoding='utf-8')
+    env_path.write_text(buf.getvalue(), encoding='utf-8')
 
 
 def run_onboarding() -> bool:
@@ -712,13 +1072,15 @@ def run_onboarding() -> bool:
     Returns:
         True if configuration was completed successfully
     """
-    console.print()
-    console.print(Panel(
-        "[bold]Welcome to ADF Agent![/bold]\n\n"
-        "No API credentials detected. Let's set up your environment.",
-        border_style="cyan",
+    console.print(Group(
+        "",
+        Panel(
+            "[bold]Welcome to ADF Agent![/bold]\n\n"
+            "No API credentials detected. Let's set up your environment.",
+            border_style="cyan",
+        ),
+        "",
     ))
-    console.print()
 
     # Step 1: Provider
     provider = _select("API Provider", [
@@ -740,14 +1102,12 @@ def run_onboarding() -> bool:
     if model is None:
         return False
 
-    console.print()
-
     # Step 3: API Key
-    console.print("  [bold]API Key[/bold]")
+    console.print("\n  [bold]API Key[/bold]")
     if is_foundry:
-        api_key = input("    Azure Foundry API Key: ").strip()
+        api_key = _prompt_line("    Azure Foundry API Key: ", secret=True).strip()
     else:
-        api_key = input("    Anthropic API Key: ").strip()
+        api_key = _prompt_line("    Anthropic API Key: ", secret=True).strip()
 
     if not api_key:
         console.print("  [red]API key is required.[/red]")
@@ -756,10 +1116,11 @@ def run_onboarding() -> bool:
     # Step 4: Base URL (Foundry only)
     base_url = ""
     if is_foundry:
-        console.print()
-        console.print("  [bold]Azure Foundry Base URL[/bold]")
-        console.print("    [dim]e.g. https://<resource>.services.ai.azure.com/anthropic[/dim]")
-        base_url = input("    Base URL: ").strip()
+        console.print(
+            "\n  [bold]Azure Foundry Base URL[/bold]\n"
+            "    [dim]e.g. https://<resource>.services.ai.azure.com/anthropic[/dim]"
+        )
+        base_url = _prompt_line("    Base URL: ").strip()
         if not base_url:
             console.print("  [red]Base URL is required for Azure Foundry.[/red]")
             return False
@@ -786,14 +1147,16 @@ def run_onboarding() -> bool:
 
     # Completion message
     provider_label = "Azure AI Foundry" if is_foundry else "Anthropic"
-    console.print()
-    console.print(Panel(
-        f"[green]Configuration saved to .env[/green]\n\n"
-        f"  Provider: [bold]{provider_label}[/bold]\n"
-        f"  Model:    [bold]{model}[/bold]\n\n"
-        f"Run [bold cyan]adf_agent[/bold cyan] again to start.",
-        border_style="green",
-        title="Setup Complete",
+    console.print(Group(
+        "",
+        Panel(
+            f"[green]Configuration saved to .env[/green]\n\n"
+            f"  Provider: [bold]{provider_label}[/bold]\n"
+            f"  Model:    [bold]{model}[/bold]\n\n"
+            f"Run [bold cyan]adf_agent[/bold cyan] again to start.",
+            border_style="green",
+            title="Setup Complete",
+        ),
     ))
 
     return True
@@ -813,12 +1176,14 @@ Helps you explore and manage Azure Data Factory resources:
     console.print(Panel(banner, title="ADF Agent", border_style="cyan"))
 
 
-def show_config_status(agent: ADFAgent = None):
+def show_config_status(agent: "ADFAgent" = None):
     """Display configuration status
 
     Args:
         agent: Optional; if provided, shows the actual session_dir
     """
+    from .context import _use_workspace, ADFConfig
+
     if agent:
         config = agent.adf_config
     else:
@@ -844,6 +1209,7 @@ def cmd_run(prompt: str, enable_thinking: bool = True):
     console.print(Panel(f"[bold cyan]User Request:[/bold cyan]\n{prompt}"))
     console.print()
 
+    from .agent import ADFAgent
     agent = ADFAgent(enable_thinking=enable_thinking)
 
     console.print("[dim]Running agent...[/dim]\n")
@@ -851,17 +1217,18 @@ def cmd_run(prompt: str, enable_thinking: bool = True):
     try:
         state = StreamState()
 
-        with Live(console=console, refresh_per_second=10, transient=True) as live:
-            live.update(create_streaming_display(is_waiting=True))
-
+        view = StreamingView(state)
+        with Live(
+            view,
+            console=console,
+            refresh_per_second=StreamingView.REFRESH_PER_SECOND,
+            transient=True,
+        ) as live:
+            should_render = ShouldRender()
             for event in agent.stream_events(prompt):
                 event_type = state.handle_event(event)
-                live.update(create_streaming_display(
-                    **state.get_display_args(),
-                    terminal_height=console.height or 25,
-                ))
-
-                if event_type in ("tool_call", "tool_result"):
+                view.waiting = False
+                if should_render(event_type):
                     live.refresh()
 
         console.print()
@@ -878,6 +1245,14 @@ def cmd_run(prompt: str, enable_thinking: bool = True):
 
 def cmd_interactive(enable_thinking: bool = True):
     """Interactive conversation mode"""
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.history import ThreadedHistory
+    from prompt_toolkit.auto_suggest import AutoSuggestFromHistory, ThreadedAutoSuggest
+    from prompt_toolkit.formatted_text import HTML
+
+    from .agent import ADFAgent
+    from .history import CappedFileHistory
+
     print_banner()
 
     agent = ADFAgent(enable_thinking=enable_thinking)
@@ -892,11 +1267,13 @@ def cmd_interactive(enable_thinking: bool = True):
 
     thread_id = "interactive"
 
-    # Initialize prompt_toolkit session
+    # Initialize prompt_toolkit session (created once, reused for every turn).
+    # History loading and suggestion lookup run in background threads so
+    # scanning a large history file never blocks keystroke handling.
     history_file = str(Path.home() / ".adf_agent_history")
     session = PromptSession(
-        history=FileHistory(history_file),
-        auto_suggest=AutoSuggestFromHistory(),
+        history=ThreadedHistory(CappedFileHistory(history_file)),
+        auto_suggest=ThreadedAutoSuggest(AutoSuggestFromHistory()),
         enable_history_search=True,
     )
 
@@ -925,19 +1302,23 @@ def cmd_interactive(enable_thinking: bool = True):
             # Run agent
             console.print()
 
+            # prompt_toolkit swaps in its own SIGWINCH handler while prompting,
+            # so a resize at the prompt never reached the cached size
+            _refresh_terminal_size()
             state = StreamState()
 
-            with Live(console=console, refresh_per_second=10, transient=True) as live:
-                live.update(create_streaming_display(is_waiting=True))
-
+            view = StreamingView(state)
+            with Live(
+                view,
+                console=console,
+                refresh_per_second=StreamingView.REFRESH_PER_SECOND,
+                transient=True,
+            ) as live:
+                should_render = ShouldRender()
                 for event in agent.stream_events(user_input, thread_id=thread_id):
                     event_type = state.handle_event(event)
-                    live.update(create_streaming_display(
-                        **state.get_display_args(),
-                        terminal_height=console.height or 25,
-                    ))
-
-                    if event_type in ("tool_call", "tool_result"):
+                    view.waiting = False
+                    if should_render(event_type):
                         live.refresh()
 
             # Display final results (simplified for interactive mode)
@@ -1030,6 +1411,10 @@ Examples:
 
     args = parser.parse_args()
 
+    # Load environment variables (deferred from import time so importing the
+    # CLI module and --help stay cheap)
+    load_dotenv(override=True)
+
     # Set working directory
     if args.cwd:
         os.chdir(args.cwd)
@@ -1039,6 +1424,12 @@ Examples:
         run_onboarding()
         sys.exit(0)
 
+    # MLflow setup runs in the background while the agent is built; ADFAgent
+    # waits for it before its first LLM call
+    start_mlflow_tracking()
+
+    _install_resize_handler()
+
     # Thinking toggle
     enable_thinking = not args.no_thinking
 
@@ -101,6 +101,11 @@ class ADFAgentContext:
             self._credential = DefaultAzureCredential()
         return self._credential
 
+    @property
+    def cache(self) -> dict:
+        """Per-session scratch cache shared by the tools (clients, list results)"""
+        return self._cache
+
     @property
     def use_workspace(self) -> bool:
         """Whether to use workspace directory (otherwise use temp files)"""
@@ -0,0 +1,23 @@
+"""
+Interactive prompt history
+
+Kept out of cli.py so importing the CLI does not load prompt_toolkit;
+cmd_interactive imports this module on first use.
+"""
+
+from itertools import islice
+
+from prompt_toolkit.history import FileHistory
+
+
+class CappedFileHistory(FileHistory):
+    """FileHistory that keeps only the newest entries in memory
+
+    The Buffer copies every loaded entry on each prompt, so an unbounded
+    history file makes every turn slower.
+    """
+    MAX_ENTRIES = 5000
+
+    def load_history_strings(self):
+        # Newest first, so this drops the oldest entries
+        return islice(super().load_history_strings(), self.MAX_ENTRIES)
@@ -4,6 +4,14 @@ Observability module for ADF Agent.
 Provides MLflow tracking and other observability integrations.
 """
 
-from .mlflow_setup import setup_mlflow_tracking
+from .mlflow_setup import (
+    setup_mlflow_tracking,
+    start_mlflow_tracking,
+    wait_for_mlflow_tracking,
+)
 
-__all__ = ["setup_mlflow_tracking"]
+__all__ = [
+    "setup_mlflow_tracking",
+    "start_mlflow_tracking",
+    "wait_for_mlflow_tracking",
+]
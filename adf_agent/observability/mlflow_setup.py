@@ -2,11 +2,17 @@
 
 import logging
 import os
+import threading
 
-import mlflow
+_setup_lock = threading.Lock()
+_setup_thread: threading.Thread | None = None
+_setup_done = threading.Event()
 
 
 def setup_mlflow_tracking() -> None:
+    # Imported here: mlflow is heavy and only needed once tracking is set up
+    import mlflow
+
     # Suppress noisy MLflow / alembic / OTel logs
     for name in ("alembic", "mlflow", "opentelemetry"):
         logging.getLogger(name).setLevel(logging.ERROR)
@@ -17,3 +23,32 @@ def setup_mlflow_tracking() -> None:
 
     mlflow.set_experiment("ADF-Agent")
     mlflow.langchain.autolog()
+
+
+def _run_setup() -> None:
+    try:
+        setup_mlflow_tracking()
+    except Exception:
+        logging.getLogger(__name__).warning("MLflow tracking setup failed", exc_info=True)
+    finally:
+        _setup_done.set()
+
+
+def start_mlflow_tracking() -> None:
+    """Run setup_mlflow_tracking() once, in a background daemon thread"""
+    global _setup_thread
+    with _setup_lock:
+        if _setup_thread is not None:
+            return
+        _setup_thread = threading.Thread(target=_run_setup, name="mlflow-setup", daemon=True)
+        _setup_thread.start()
+
+
+def wait_for_mlflow_tracking(timeout: float | None = None) -> bool:
+    """Block until background setup has finished (no-op if it was never started)
+
+    Called before the first LLM request so autolog hooks are installed in time.
+    """
+    if _setup_thread is None:
+        return True
+    return _setup_done.wait(timeout)
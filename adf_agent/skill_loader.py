@@ -21,12 +21,12 @@ SKILL.md format:
     Detailed instruction content...
 """
 
+import os
 import re
 from pathlib import Path
 from typing import Optional
-from dataclasses import dataclass
-
-import yaml
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 
 # Default Skills search paths (project-level first, user-level fallback)
@@ -35,6 +35,11 @@ DEFAULT_SKILL_PATHS = [
     Path.home() / ".claude" / "skills",   # User-level Skills - fallback
 ]
 
+# SKILL.md frontmatter block (matched on raw bytes); match.end() is the body offset
+_FRONTMATTER_RE = re.compile(rb'\A---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+_FRONTMATTER_CHUNK = 4096
+_FRONTMATTER_CAP = 8192  # past this, read the rest of the file in one go
+
 
 @dataclass
 class SkillMetadata:
@@ -46,6 +51,9 @@ class SkillMetadata:
     name: str               # Unique skill name
     description: str        # Description of when to use this skill
     skill_path: Path        # Skill directory path
+    _body_offset: int = field(default=0, repr=False, compare=False)
+    _body_cache: Optional[str] = field(default=None, repr=False, compare=False)
+    _mtime_ns: int = field(default=0, repr=False, compare=False)
 
     def to_prompt_line(self) -> str:
         """Generate a single-line description for the system prompt"""
@@ -63,6 +71,15 @@ class SkillContent:
     instructions: str  # SKILL.md body content
 
 
+@lru_cache(maxsize=1)
+def _get_yaml():
+    """Import PyYAML on first use; returns (yaml module, fastest safe Loader)"""
+    import yaml
+
+    # CSafeLoader (libyaml C extension) only exists when PyYAML was built with it
+    return yaml, getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 class SkillLoader:
     """
     Skills Loader
@@ -83,6 +100,8 @@ class SkillLoader:
         """
         self.skill_paths = skill_paths or DEFAULT_SKILL_PATHS
         self._metadata_cache: dict[str, SkillMetadata] = {}
+        # SKILL.md path -> (file mtime_ns, parsed metadata or None if invalid)
+        self._skill_md_cache: dict[Path, tuple[int, Optional[SkillMetadata]]] = {}
 
     def scan_skills(self) -> list[SkillMetadata]:
         """
@@ -90,37 +109,64 @@ class SkillLoader:
 
         Traverses skill_paths, finds directories containing SKILL.md,
         and parses YAML frontmatter to extract name and description.
+        Every SKILL.md is stat'ed on each scan (so a skill folder whose
+        SKILL.md is written later, or an edited file, is picked up), but only
+        files whose mtime changed are parsed again.
 
         Returns:
             List of all discovered Skills metadata
         """
         skills = []
-        seen_names = set()
+        by_name: dict[str, SkillMetadata] = {}
 
         for base_path in self.skill_paths:
-            if not base_path.exists():
-                continue
+            for metadata in self._scan_base_path(base_path):
+                if metadata.name not in by_name:
+                    skills.append(metadata)
+                    by_name[metadata.name] = metadata
 
-            for skill_dir in base_path.iterdir():
-                if not skill_dir.is_dir():
+        # Rebuilt rather than updated, so renamed or removed skills drop out
+        self._metadata_cache = by_name
+        return skills
+
+    def _scan_base_path(self, base_path: Path) -> list[SkillMetadata]:
+        """Return Skills under one search path, re-parsing only changed SKILL.md files"""
+        found = []
+        try:
+            entries = os.scandir(base_path)
+        except OSError:
+            return found
+
+        with entries:
+            for entry in entries:
+                if not entry.is_dir():
                     continue
 
-                skill_md = skill_dir / "SKILL.md"
-                if not skill_md.exists():
+                skill_md = Path(entry.path, "SKILL.md")
+                try:
+                    mtime = skill_md.stat().st_mtime_ns
+                except OSError:
+                    self._skill_md_cache.pop(skill_md, None)
                     continue
 
-                metadata = self._parse_skill_metadata(skill_md)
-                if metadata and metadata.name not in seen_names:
-                    skills.append(metadata)
-                    seen_names.add(metadata.name)
-                    self._metadata_cache[metadata.name] = metadata
+                cached = self._skill_md_cache.get(skill_md)
+                if cached is not None and cached[0] == mtime:
+                    metadata = cached[1]
+                else:
+                    metadata = self._parse_skill_metadata(skill_md)
+                    self._skill_md_cache[skill_md] = (mtime, metadata)
 
-        return skills
+                if metadata:
+                    found.append(metadata)
+
+        return found
 
     def _parse_skill_metadata(self, skill_md_path: Path) -> Optional[SkillMetadata]:
         """
         Parse YAML frontmatter from SKILL.md
 
+        Only the head of the file is read; the body is loaded later by load_skill().
+
         Args:
             skill_md_path: Path to the SKILL.md file
 
@@ -128,21 +174,27 @@ class SkillLoader:
             Parsed metadata, or None on failure
         """
         try:
-            content = skill_md_path.read_text(encoding="utf-8")
+            with open(skill_md_path, "rb") as f:
+                mtime = os.fstat(f.fileno()).st_mtime_ns
+                head = f.read(_FRONTMATTER_CHUNK)
+                if not head.startswith(b"---"):
+                    return None
+
+                frontmatter_match = _FRONTMATTER_RE.match(head)
+                while not frontmatter_match:
+                    chunk = f.read(_FRONTMATTER_CHUNK if len(head) < _FRONTMATTER_CAP else -1)
+                    if not chunk:
+                        return None
+                    head += chunk
+                    frontmatter_match = _FRONTMATTER_RE.match(head)
+
+            frontmatter_text = frontmatter_match.group(1).decode("utf-8")
         except Exception:
             return None
 
-        frontmatter_match = re.match(
-            r'^---\s*\n(.*?)\n---\s*\n',
-            content,
-            re.DOTALL
-        )
-
-        if not frontmatter_match:
-            return None
-
+        yaml, loader = _get_yaml()
         try:
-            frontmatter = yaml.safe_load(frontmatter_match.group(1))
+            frontmatter = yaml.load(frontmatter_text, Loader=loader)
 
             name = frontmatter.get("name", "")
             description = frontmatter.get("description", "")
@@ -154,6 +206,8 @@ class SkillLoader:
                 name=name,
                 description=description,
                 skill_path=skill_md_path.parent,
+                _body_offset=frontmatter_match.end(),
+                _mtime_ns=mtime,
             )
         except yaml.YAMLError:
             return None
@@ -162,7 +216,9 @@ class SkillLoader:
         """
         Level 2: Load full Skill content
 
-        Reads the complete instructions from SKILL.md.
+        Reads the complete instructions from SKILL.md. The body is kept in
+        memory; when the file's mtime changes the Skills are re-scanned, so an
+        edit to the name, description or body is picked up.
 
         Args:
             skill_name: Skill name (e.g. "news-extractor")
@@ -171,6 +227,15 @@ class SkillLoader:
             Full Skill content, or None if not found
         """
         metadata = self._metadata_cache.get(skill_name)
+        if metadata:
+            try:
+                mtime = (metadata.skill_path / "SKILL.md").stat().st_mtime_ns
+            except OSError:
+                mtime = None
+            if mtime != metadata._mtime_ns:
+                # Edited or removed since it was parsed: the name may have changed too
+                metadata = None
+
         if not metadata:
             self.scan_skills()
             metadata = self._metadata_cache.get(skill_name)
@@ -179,19 +244,19 @@ class SkillLoader:
             return None
 
         skill_md = metadata.skill_path / "SKILL.md"
-        try:
-            content = skill_md.read_text(encoding="utf-8")
-        except Exception:
-            return None
+        if metadata._body_cache is None:
+            try:
+                with open(skill_md, "rb") as f:
+                    f.seek(metadata._body_offset)
+                    body = f.read().decode("utf-8")
+            except Exception:
+                return None
 
-        body_match = re.match(
-            r'^---\s*\n.*?\n---\s*\n(.*)$',
-            content,
-            re.DOTALL
-        )
-        instructions = body_match.group(1).strip() if body_match else content
+            # Binary read skips universal newlines, so normalize like read_text() would
+            body = body.replace("\r\n", "\n").replace("\r", "\n")
+            metadata._body_cache = body.strip()
 
         return SkillContent(
             metadata=metadata,
-            instructions=instructions,
+            instructions=metadata._body_cache,
         )
@@ -3,13 +3,14 @@ Stream submodule - Streaming event processing
 
 Provides:
 - StreamEventEmitter: Event emitter
+- coalesce_deltas: Merge consecutive text/thinking deltas
 - ToolCallTracker: Tool call tracker
 - ToolResultFormatter: Tool result formatter
 - Utility functions: has_args, is_success, resolve_path, truncate, get_status_symbol
 - Constants: SUCCESS_PREFIX, FAILURE_PREFIX, DisplayLimits
 """
 
-from .emitter import StreamEventEmitter, StreamEvent
+from .emitter import StreamEventEmitter, StreamEvent, coalesce_deltas
 from .tracker import ToolCallTracker, ToolCallInfo
 from .formatter import ToolResultFormatter, ContentType, FormattedResult
 from .token_tracker import TokenTracker, TokenUsageInfo
@@ -27,12 +28,14 @@ from .utils import (
     count_lines,
     truncate_with_line_hint,
     get_status_symbol,
+    refresh_unicode_support,
 )
 
 __all__ = [
     # Emitter
     "StreamEventEmitter",
     "StreamEvent",
+    "coalesce_deltas",
     # Tracker
     "ToolCallTracker",
     "ToolCallInfo",
@@ -57,4 +60,5 @@ __all__ = [
     "count_lines",
     "truncate_with_line_hint",
     "get_status_symbol",
+    "refresh_unicode_support",
 ]
@@ -1,19 +1,32 @@
 """
 StreamEventEmitter - Unified event format
 
-All events contain a type and associated data.
+All events contain a type and associated data. The type lives on the event
+itself; the data dict holds only the payload fields.
 """
 
-from dataclasses import dataclass
-from typing import Any, Dict
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, NamedTuple
 
+from .._jsoncodec import dumps
 
-@dataclass
-class StreamEvent:
-    """Unified stream event"""
+# Delta event types whose consecutive fragments can be merged
+_COALESCE_TYPES = frozenset(("text", "thinking"))
+
+
+class StreamEvent(NamedTuple):
+    """Unified stream event
+
+    A NamedTuple rather than a frozen dataclass: construction happens once per
+    streamed token and tuple creation skips the per-field object.__setattr__.
+    """
     type: str
     data: Dict[str, Any]
 
+    def to_bytes(self) -> bytes:
+        """Serialize as a flat UTF-8 JSON object, e.g. for JSON-lines logs or IPC"""
+        return dumps({"type": self.type, **self.data}, default=str)
+
 
 class StreamEventEmitter:
     """Stream event emitter"""
@@ -21,23 +34,22 @@ class StreamEventEmitter:
     @staticmethod
     def thinking(content: str, thinking_id: int = 0) -> StreamEvent:
         """Thinking content event"""
-        return StreamEvent("thinking", {"type": "thinking", "content": content, "id": thinking_id})
+        return StreamEvent("thinking", {"content": content, "id": thinking_id})
 
     @staticmethod
     def text(content: str) -> StreamEvent:
         """Text content event"""
-        return StreamEvent("text", {"type": "text", "content": content})
+        return StreamEvent("text", {"content": content})
 
     @staticmethod
     def tool_call(name: str, args: Dict[str, Any], tool_id: str = "") -> StreamEvent:
         """Tool call event"""
-        return StreamEvent("tool_call", {"type": "tool_call", "name": name, "args": args, "id": tool_id})
+        return StreamEvent("tool_call", {"name": name, "args": args, "id": tool_id})
 
     @staticmethod
     def tool_result(name: str, content: str, success: bool = True) -> StreamEvent:
         """Tool result event"""
         return StreamEvent("tool_result", {
-            "type": "tool_result",
             "name": name,
             "content": content,
             "success": success,
@@ -46,12 +58,12 @@ class StreamEventEmitter:
     @staticmethod
     def done(response: str = "") -> StreamEvent:
         """Done event"""
-        return StreamEvent("done", {"type": "done", "response": response})
+        return StreamEvent("done", {"response": response})
 
     @staticmethod
     def error(message: str) -> StreamEvent:
         """Error event"""
-        return StreamEvent("error", {"type": "error", "message": message})
+        return StreamEvent("error", {"message": message})
 
     @staticmethod
     def token_usage(
@@ -70,7 +82,6 @@ class StreamEventEmitter:
             parallel_count: Number of tools executed in parallel in this API call (>1 means parallel tool use)
         """
         return StreamEvent("token_usage", {
-            "type": "token_usage",
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
             "total_tokens": total_tokens or (input_tokens + output_tokens),
@@ -79,3 +90,63 @@ class StreamEventEmitter:
             "is_total": is_total,
             "parallel_count": parallel_count,
         })
+
+
+def _merge_deltas(first: StreamEvent, parts: list[str]) -> StreamEvent:
+    """Combine buffered fragments into a single event shaped like the first"""
+    if len(parts) == 1:
+        return first
+    return StreamEvent(first.type, {**first.data, "content": "".join(parts)})
+
+
+def coalesce_deltas(
+    events: Iterable[StreamEvent],
+    window: float = 0.016,
+    clock: Callable[[], float] = time.monotonic,
+) -> Iterator[StreamEvent]:
+    """Merge runs of consecutive text/thinking deltas into fewer events
+
+    A run is emitted as soon as a different event arrives (so ordering around
+    tool calls is preserved), when a fragment contains a newline, or once it
+    has been buffering for `window` seconds as of the next fragment. Runs in
+    the consumer's thread; if the consumer stops early, the upstream
+    generator is closed with it.
+    """
+    pending: StreamEvent | None = None
+    parts: list[str] = []
+    started = 0.0
+
+    try:
+        for ev in events:
+            if pending is not None and (
+                ev.type != pending.type or ev.data.get("id") != pending.data.get("id")
+            ):
+                yield _merge_deltas(pending, parts)
+                pending = None
+
+            if ev.type not in _COALESCE_TYPES:
+                yield ev
+                continue
+
+            content = ev.data.get("content", "")
+            if pending is None:
+                pending, parts, started = ev, [content], clock()
+            else:
+                parts.append(content)
+
+            if "\n" in content or clock() - started >= window:
+                yield _merge_deltas(pending, parts)
+                pending = None
+
+        if pending is not None:
+            yield _merge_deltas(pending, parts)
+    except Exception:
+        # Upstream failed: show the text it produced before re-raising
+        if pending is not None:
+            yield _merge_deltas(pending, parts)
+        raise
+    finally:
+        # Consumer stopped early (break / Ctrl-C): stop the agent run as well
+        close = getattr(events, "close", None)
+        if close is not None:
+            close()
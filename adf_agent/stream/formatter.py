@@ -14,7 +14,19 @@ from rich.syntax import Syntax
 from rich.text import Text
 from rich.markdown import Markdown
 
-from .utils import SUCCESS_PREFIX, FAILURE_PREFIX, is_success as _is_success, truncate
+from .._jsoncodec import dumps_indented as _json_dumps_indented, loads as _json_loads
+from .utils import (
+    SUCCESS_PREFIX,
+    FAILURE_PREFIX,
+    ERROR_PATTERNS,
+    is_success as _is_success,
+    truncate,
+)
+
+# Bodies above this size are not parsed as JSON; they fall through to the
+# error/markdown/text detectors, like any other non-JSON output
+_MAX_JSON_PROBE = 65_536
+_EDGE_PROBE = 256  # Slice length used to find the first/last non-space char
 
 
 class ContentType(Enum):
@@ -26,7 +38,7 @@ class ContentType(Enum):
     TEXT = "text"
 
 
-@dataclass
+@dataclass(slots=True)
 class FormattedResult:
     """Formatted result"""
     content_type: ContentType
@@ -44,15 +56,44 @@ class ToolResultFormatter:
             console.print(elem)
     """
 
+    # Shared detection patterns, built once per class rather than per call.
+    # Plain substring scans: for a handful of literals, str.__contains__ beats
+    # a regex alternation on large outputs.
+    ERROR_PATTERNS = ERROR_PATTERNS  # Same patterns is_success() uses
+    MARKDOWN_PATTERNS = ('```', '**', '##')  # '- **' is already covered by '**'
+
+    # Content type -> formatting method name (resolved with getattr so
+    # subclass overrides still apply)
+    _DISPATCH = {
+        ContentType.SUCCESS: "_format_success",
+        ContentType.ERROR: "_format_error",
+        ContentType.JSON: "_format_json",
+        ContentType.MARKDOWN: "_format_markdown",
+        ContentType.TEXT: "_format_text",
+    }
+
+    def __init__(self):
+        # (content passed to detect_type, parsed JSON) so _format_json can skip
+        # a second json.loads of the same body
+        self._json_cache: tuple[str, Any] | None = None
+
     def detect_type(self, content: str) -> ContentType:
         """Detect content type"""
-        content = content.strip()
+        return self._detect_type(content.strip())
+
+    def _detect_type(self, content: str, source: str | None = None) -> ContentType:
+        """Detect content type of already-stripped content
 
+        Args:
+            content: Stripped tool output
+            source: Original tool output, passed only by format() so a parsed
+                JSON body is kept for the _format_json call that follows
+        """
         # 1. Status prefix based detection (highest priority)
         if content.startswith(SUCCESS_PREFIX):
             # Check for JSON output
             body = self._extract_body(content)
-            if self._is_json(body):
+            if self._is_json(body, source):
                 return ContentType.JSON
             return ContentType.SUCCESS
 
@@ -60,7 +101,7 @@ class ToolResultFormatter:
             return ContentType.ERROR
 
         # 2. JSON detection
-        if self._is_json(content):
+        if self._is_json(content, source):
             return ContentType.JSON
 
         # 3. Actual error detection
@@ -79,19 +120,14 @@ class ToolResultFormatter:
 
     def format(self, name: str, content: str, max_length: int = 800) -> FormattedResult:
         """Format tool result"""
-        content_type = self.detect_type(content)
-        success = self.is_success(content)
+        # Strip once and share it between type detection and the success check
+        self._json_cache = None
+        stripped = content.strip()
+        content_type = self._detect_type(stripped, content)
+        success = self.is_success(stripped)
 
         # Dispatch to specific formatting method
-        formatter_map = {
-            ContentType.SUCCESS: self._format_success,
-            ContentType.ERROR: self._format_error,
-            ContentType.JSON: self._format_json,
-            ContentType.MARKDOWN: self._format_markdown,
-            ContentType.TEXT: self._format_text,
-        }
-
-        formatter = formatter_map.get(content_type, self._format_text)
+        formatter = getattr(self, self._DISPATCH.get(content_type, "_format_text"))
         elements = formatter(name, content, max_length)
 
         return FormattedResult(content_type=content_type, elements=elements, success=success)
@@ -103,33 +139,40 @@ class ToolResultFormatter:
         lines = content.split("\n", 2)
         return lines[2].strip() if len(lines) > 2 else ""
 
-    def _is_json(self, content: str) -> bool:
-        """Check if content is JSON"""
-        content = content.strip()
-        if not content:
+    def _is_json(self, content: str, source: str | None = None) -> bool:
+        """Check if content is JSON
+
+        Args:
+            content: Text to check
+            source: Original tool output; when given, the parsed value is kept
+                for _format_json to reuse
+        """
+        # First/last non-space chars from short edge slices, no full strip() copy
+        first = content[:_EDGE_PROBE].lstrip()[:1] or content.lstrip()[:1]
+        if first not in ('{', '['):
+            return False
+        last = content[-_EDGE_PROBE:].rstrip()[-1:] or content.rstrip()[-1:]
+        if last != ('}' if first == '{' else ']'):
+            return False
+
+        if len(content) > _MAX_JSON_PROBE:
             return False
-        if (content.startswith('{') and content.endswith('}')) or \
-           (content.startswith('[') and content.endswith(']')):
-            try:
-                json.loads(content)
-                return True
-            except (json.JSONDecodeError, ValueError):
-                pass
-        return False
+
+        try:
+            data = _json_loads(content)
+        except (json.JSONDecodeError, ValueError):
+            return False
+        if source is not None:
+            self._json_cache = (source, data)
+        return True
 
     def _is_error(self, content: str) -> bool:
         """Check if content is an error"""
-        error_patterns = [
-            'Traceback (most recent call last)',
-            'Exception:',
-            'Error:',
-        ]
-        return any(pattern in content for pattern in error_patterns)
+        return any(pattern in content for pattern in self.ERROR_PATTERNS)
 
     def _is_markdown(self, content: str) -> bool:
         """Check if content is Markdown"""
-        md_patterns = ['```', '**', '##', '- **']
-        return content.startswith('#') or any(p in content for p in md_patterns)
+        return content.startswith('#') or any(p in content for p in self.MARKDOWN_PATTERNS)
 
     # === Private methods: Formatting ===
 
@@ -153,14 +196,18 @@ class ToolResultFormatter:
 
     def _format_json(self, name: str, content: str, max_length: int) -> List[Any]:
         """Format JSON output"""
-        # Extract JSON content
-        json_content = content
-        if content.startswith(SUCCESS_PREFIX):
-            json_content = self._extract_body(content)
+        cached, self._json_cache = self._json_cache, None
 
         try:
-            data = json.loads(json_content)
-            formatted = json.dumps(data, indent=2, ensure_ascii=False)
+            if cached is not None and cached[0] is content:
+                data = cached[1]
+            else:
+                # Extract JSON content
+                json_content = content
+                if content.startswith(SUCCESS_PREFIX):
+                    json_content = self._extract_body(content)
+                data = _json_loads(json_content)
+            formatted = _json_dumps_indented(data)
             formatted = self._truncate(formatted, max_length)
             return [
                 Text(f"{name}", style="cyan bold"),
@@ -188,4 +235,7 @@ class ToolResultFormatter:
 
     def _truncate(self, content: str, max_length: int) -> str:
         """Truncate content"""
+        # The common no-op case returns without the extra call into utils
+        if len(content) <= max_length:
+            return content
         return truncate(content, max_length)
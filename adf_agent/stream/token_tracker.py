@@ -14,12 +14,16 @@ LangChain's input_tokens = raw_input + cache_creation + cache_read,
 i.e. cache tokens are a subset of input_tokens, not additional.
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from langchain_core.messages import AIMessage, AIMessageChunk
+if TYPE_CHECKING:
+    from langchain_core.messages import AIMessage, AIMessageChunk
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenUsageInfo:
     """Token usage information"""
     input_tokens: int = 0
@@ -30,6 +34,8 @@ class TokenUsageInfo:
 
     def __add__(self, other: "TokenUsageInfo") -> "TokenUsageInfo":
         """Support + operator for accumulation"""
+        if other.is_empty():
+            return self
         return TokenUsageInfo(
             input_tokens=self.input_tokens + other.input_tokens,
             output_tokens=self.output_tokens + other.output_tokens,
@@ -43,7 +49,7 @@ class TokenUsageInfo:
         return self.total_tokens == 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenTracker:
     """
     Token usage tracker
@@ -78,17 +84,19 @@ class TokenTracker:
             self._extract_usage(usage)
 
         if input_tokens > 0 or output_tokens > 0:
-            # Merge: take max to preserve non-zero values from each chunk
+            # Merge: take max to preserve non-zero values from each chunk.
+            # Updated in place: _current_turn is private until finalize_turn()
+            # hands it out and swaps in a fresh object.
             cur = self._current_turn
-            merged_input = max(cur.input_tokens, input_tokens)
-            merged_output = max(cur.output_tokens, output_tokens)
-            self._current_turn = TokenUsageInfo(
-                input_tokens=merged_input,
-                output_tokens=merged_output,
-                total_tokens=merged_input + merged_output,
-                cache_creation_input_tokens=max(cur.cache_creation_input_tokens, cache_creation),
-                cache_read_input_tokens=max(cur.cache_read_input_tokens, cache_read),
-            )
+            if input_tokens > cur.input_tokens:
+                cur.input_tokens = input_tokens
+            if output_tokens > cur.output_tokens:
+                cur.output_tokens = output_tokens
+            if cache_creation > cur.cache_creation_input_tokens:
+                cur.cache_creation_input_tokens = cache_creation
+            if cache_read > cur.cache_read_input_tokens:
+                cur.cache_read_input_tokens = cache_read
+            cur.total_tokens = cur.input_tokens + cur.output_tokens
             self._has_current_usage = True
 
     @staticmethod
@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallInfo:
     """Tool call information"""
     id: str
@@ -47,6 +47,9 @@ class ToolCallTracker:
 
     def __init__(self):
         self._calls: Dict[str, ToolCallInfo] = {}
+        # Not-yet-emitted subset of _calls (insertion ordered), so pending
+        # lookups don't rescan every call seen this session
+        self._pending: Dict[str, ToolCallInfo] = {}
         # Track the last tool_id (for input_json_delta which lacks an id)
         self._last_tool_id: Optional[str] = None
 
@@ -66,12 +69,14 @@ class ToolCallTracker:
             args_complete: Whether args are complete. Distinguishes "args is empty dict" from "args will arrive via delta"
         """
         if tool_id not in self._calls:
-            self._calls[tool_id] = ToolCallInfo(
+            info = ToolCallInfo(
                 id=tool_id,
                 name=name or "",
                 args=args or {},
                 args_complete=args_complete,
             )
+            self._calls[tool_id] = info
+            self._pending[tool_id] = info
             self._last_tool_id = tool_id
         else:
             info = self._calls[tool_id]
@@ -119,8 +124,9 @@ class ToolCallTracker:
 
     def mark_emitted(self, tool_id: str) -> None:
         """Mark as emitted"""
-        if tool_id in self._calls:
-            self._calls[tool_id].emitted = True
+        info = self._pending.pop(tool_id, None)
+        if info is not None:
+            info.emitted = True
 
     def get(self, tool_id: str) -> Optional[ToolCallInfo]:
         """Get tool call information"""
@@ -128,11 +134,12 @@ class ToolCallTracker:
 
     def get_pending(self) -> list[ToolCallInfo]:
         """Get all pending (not yet emitted) tool calls"""
-        return [info for info in self._calls.values() if not info.emitted]
+        return list(self._pending.values())
 
     def emit_all_pending(self) -> list[ToolCallInfo]:
         """Emit all pending tool calls and mark them"""
-        pending = self.get_pending()
+        pending = list(self._pending.values())
+        self._pending.clear()
         for info in pending:
             info.emitted = True
         return pending
@@ -140,3 +147,4 @@ class ToolCallTracker:
     def clear(self) -> None:
         """Clear the tracker"""
         self._calls.clear()
+        self._pending.clear()
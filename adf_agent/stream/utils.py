@@ -5,6 +5,7 @@ Provides unified helper functions and constant definitions.
 """
 
 import sys
+from itertools import islice
 from pathlib import Path, PurePath
 from enum import Enum
 
@@ -13,6 +14,13 @@ from enum import Enum
 SUCCESS_PREFIX = "[OK]"
 FAILURE_PREFIX = "[FAILED]"
 
+# Substrings that mark unprefixed output as a failure
+ERROR_PATTERNS = (
+    'Traceback (most recent call last)',
+    'Exception:',
+    'Error:',
+)
+
 
 # === Tool status indicators ===
 class ToolStatus(str, Enum):
@@ -23,6 +31,37 @@ class ToolStatus(str, Enum):
     PENDING = "○"   # Pending - gray
 
 
+# ASCII fallback symbols for terminals without Unicode support
+_ASCII_STATUS = {
+    ToolStatus.RUNNING: "*",
+    ToolStatus.SUCCESS: "+",
+    ToolStatus.ERROR: "x",
+    ToolStatus.PENDING: "-",
+}
+
+
+def _detect_unicode_support() -> bool:
+    """Check whether stdout's encoding can represent the status symbols"""
+    try:
+        return bool(
+            sys.stdout.encoding
+            and 'utf' in sys.stdout.encoding.lower()
+        )
+    except Exception:
+        return False
+
+
+# stdout's encoding doesn't change during a run, so probe it once
+_SUPPORTS_UNICODE = _detect_unicode_support()
+
+
+def refresh_unicode_support() -> bool:
+    """Re-probe stdout's encoding, e.g. after sys.stdout was replaced"""
+    global _SUPPORTS_UNICODE
+    _SUPPORTS_UNICODE = _detect_unicode_support()
+    return _SUPPORTS_UNICODE
+
+
 def get_status_symbol(status: ToolStatus) -> str:
     """
     Get status symbol, with ASCII fallback for Windows cmd.exe
@@ -36,26 +75,9 @@ def get_status_symbol(status: ToolStatus) -> str:
     Returns:
         Status symbol (Unicode or ASCII)
     """
-    # Check Unicode support
-    try:
-        supports_unicode = (
-            sys.stdout.encoding
-            and 'utf' in sys.stdout.encoding.lower()
-        )
-    except Exception:
-        supports_unicode = False
-
-    if supports_unicode:
+    if _SUPPORTS_UNICODE:
         return status.value
-
-    # ASCII fallback
-    fallback = {
-        ToolStatus.RUNNING: "*",
-        ToolStatus.SUCCESS: "+",
-        ToolStatus.ERROR: "x",
-        ToolStatus.PENDING: "-",
-    }
-    return fallback.get(status, "?")
+    return _ASCII_STATUS.get(status, "?")
 
 
 # === Display limit constants ===
@@ -98,18 +120,16 @@ def is_success(content: str) -> bool:
     Returns:
         True if execution was successful
     """
-    content = content.strip()
+    # Only the prefix checks care about leading whitespace; skip the copy
+    # for the common case of output that starts with a visible character
+    if content[:1].isspace():
+        content = content.lstrip()
     if content.startswith(SUCCESS_PREFIX):
         return True
     if content.startswith(FAILURE_PREFIX):
         return False
     # Other cases: detect error patterns
-    error_patterns = [
-        'Traceback (most recent call last)',
-        'Exception:',
-        'Error:',
-    ]
-    return not any(pattern in content for pattern in error_patterns)
+    return not any(pattern in content for pattern in ERROR_PATTERNS)
 
 
 def resolve_path(file_path: str, working_directory: Path) -> Path:
@@ -123,7 +143,9 @@ def resolve_path(file_path: str, working_directory: Path) -> Path:
     Returns:
         Resolved absolute path
     """
-    path = Path(file_path).expanduser()  # Handle ~ expansion
+    path = Path(file_path)
+    if file_path.startswith("~"):
+        path = path.expanduser()  # Handle ~ expansion
     if not path.is_absolute():
         path = working_directory / path
     return path
@@ -148,6 +170,81 @@ def truncate(content: str, max_length: int, suffix: str = "\n... (truncated)") -
 
 # === Claude Code style compact formatting ===
 
+def _shorten_path(path: str, limit: int = 40) -> str:
+    """Show only the last two path components of a long path (cross-platform)"""
+    if len(path) > limit:
+        parts = PurePath(path).parts
+        if len(parts) > 2:
+            return ".../" + "/".join(parts[-2:])
+    return path
+
+
+def _fmt_bash(args: dict) -> str:
+    cmd = args.get("command", "")
+    # Truncate long commands
+    if len(cmd) > 50:
+        cmd = cmd[:47] + "..."
+    return f"Bash({cmd})"
+
+
+def _fmt_read(args: dict) -> str:
+    return f"Read({_shorten_path(args.get('file_path', ''))})"
+
+
+def _fmt_write(args: dict) -> str:
+    return f"Write({_shorten_path(args.get('file_path', ''))})"
+
+
+def _fmt_edit(args: dict) -> str:
+    return f"Edit({_shorten_path(args.get('file_path', ''))})"
+
+
+def _fmt_glob(args: dict) -> str:
+    pattern = args.get("pattern", "")
+    if len(pattern) > 40:
+        pattern = pattern[:37] + "..."
+    return f"Glob({pattern})"
+
+
+def _fmt_grep(args: dict) -> str:
+    pattern = args.get("pattern", "")
+    path = args.get("path", ".")
+    if len(pattern) > 30:
+        pattern = pattern[:27] + "..."
+    return f"Grep({pattern}, {path})"
+
+
+def _fmt_list_dir(args: dict) -> str:
+    return f"ListDir({args.get('path', '.')})"
+
+
+def _fmt_exec_python(args: dict) -> str:
+    code = args.get("code", "")
+    # Show first line of code or first 30 characters
+    first_line = code.partition('\n')[0]
+    if len(first_line) > 30:
+        first_line = first_line[:27] + "..."
+    return f"exec_python({first_line})"
+
+
+# Lowercased tool name -> compact formatter for common tools
+_FORMATTERS = {
+    "bash": _fmt_bash,
+    "read": _fmt_read,
+    "read_file": _fmt_read,
+    "write": _fmt_write,
+    "write_file": _fmt_write,
+    "edit": _fmt_edit,
+    "glob": _fmt_glob,
+    "grep": _fmt_grep,
+    "list_dir": _fmt_list_dir,
+    "exec_python": _fmt_exec_python,
+}
+
+# Arguments shown (in this order) for adf_* tools
+_ADF_KEYS = ("name", "filter_type", "minutes")
+
+
 def format_tool_compact(name: str, args: dict | None) -> str:
     """
     Format as Claude Code style compact format: ToolName(arg1, arg2, ...)
@@ -164,72 +261,15 @@ def format_tool_compact(name: str, args: dict | None) -> str:
 
     # Extract key parameters for common tools
     name_lower = name.lower()
-
-    if name_lower == "bash":
-        cmd = args.get("command", "")
-        # Truncate long commands
-        if len(cmd) > 50:
-            cmd = cmd[:47] + "..."
-        return f"Bash({cmd})"
-
-    elif name_lower in ("read", "read_file"):
-        path = args.get("file_path", "")
-        # Show only filename or short path (cross-platform compatible)
-        if len(path) > 40:
-            path_obj = PurePath(path)
-            parts = path_obj.parts
-            if len(parts) > 2:
-                path = ".../" + "/".join(parts[-2:])
-        return f"Read({path})"
-
-    elif name_lower in ("write", "write_file"):
-        path = args.get("file_path", "")
-        if len(path) > 40:
-            path_obj = PurePath(path)
-            parts = path_obj.parts
-            if len(parts) > 2:
-                path = ".../" + "/".join(parts[-2:])
-        return f"Write({path})"
-
-    elif name_lower == "edit":
-        path = args.get("file_path", "")
-        if len(path) > 40:
-            path_obj = PurePath(path)
-            parts = path_obj.parts
-            if len(parts) > 2:
-                path = ".../" + "/".join(parts[-2:])
-        return f"Edit({path})"
-
-    elif name_lower == "glob":
-        pattern = args.get("pattern", "")
-        if len(pattern) > 40:
-            pattern = pattern[:37] + "..."
-        return f"Glob({pattern})"
-
-    elif name_lower == "grep":
-        pattern = args.get("pattern", "")
-        path = args.get("path", ".")
-        if len(pattern) > 30:
-            pattern = pattern[:27] + "..."
-        return f"Grep({pattern}, {path})"
-
-    elif name_lower == "list_dir":
-        path = args.get("path", ".")
-        return f"ListDir({path})"
-
-    elif name_lower == "exec_python":
-        code = args.get("code", "")
-        # Show first line of code or first 30 characters
-        first_line = code.split('\n')[0] if code else ""
-        if len(first_line) > 30:
-            first_line = first_line[:27] + "..."
-        return f"exec_python({first_line})"
+    formatter = _FORMATTERS.get(name_lower)
+    if formatter is not None:
+        return formatter(args)
 
     # Compact format for ADF tools
-    elif name_lower.startswith("adf_"):
+    if name_lower.startswith("adf_"):
         # Extract key parameters
         key_params = []
-        for key in ["name", "filter_type", "minutes"]:
+        for key in _ADF_KEYS:
             if key in args:
                 val = str(args[key])
                 if len(val) > 20:
@@ -240,7 +280,7 @@ def format_tool_compact(name: str, args: dict | None) -> str:
 
     # Default format: show first few parameters
     params = []
-    for k, v in list(args.items())[:2]:
+    for k, v in islice(args.items(), 2):
         v_str = str(v)
         if len(v_str) > 20:
             v_str = v_str[:17] + "..."
@@ -273,12 +313,12 @@ def format_tree_output(lines: list[str], max_lines: int = 5, indent: str = "  ")
     if not lines:
         return ""
 
-    result = []
     display_lines = lines[:max_lines]
 
-    for i, line in enumerate(display_lines):
-        prefix = "└" if i == 0 else " "
-        result.append(f"{indent}{prefix} {line}")
+    # First line gets the tree branch, the rest are aligned under it
+    result = [f"{indent}└ {display_lines[0]}"] if display_lines else []
+    continuation = f"{indent}  "
+    result.extend([continuation + line for line in display_lines[1:]])
 
     # Show collapse hint if there are more lines
     remaining = len(lines) - max_lines
@@ -292,7 +332,10 @@ def count_lines(content: str) -> int:
     """Count lines in content"""
     if not content:
         return 0
-    return len(content.strip().split("\n"))
+    content = content.strip()
+    if not content:
+        return 0
+    return content.count("\n") + 1
 
 
 def truncate_with_line_hint(content: str, max_lines: int = 5) -> tuple[str, int]:
@@ -306,12 +349,13 @@ def truncate_with_line_hint(content: str, max_lines: int = 5) -> tuple[str, int]
     Returns:
         (truncated content, remaining line count)
     """
-    lines = content.strip().split("\n")
-    total = len(lines)
+    content = content.strip()
+    # Split at most max_lines times; the tail stays one string and is only counted
+    head = content.split("\n", max_lines)
 
-    if total <= max_lines:
-        return content.strip(), 0
+    if len(head) <= max_lines:
+        return content, 0
 
-    truncated = "\n".join(lines[:max_lines])
-    remaining = total - max_lines
+    truncated = "\n".join(head[:max_lines])
+    remaining = content.count("\n") + 1 - max_lines
     return truncated, remaining
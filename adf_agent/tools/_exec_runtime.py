@@ -11,6 +11,9 @@ import sys  # noqa: F401
 from collections import Counter, defaultdict  # noqa: F401
 from pathlib import Path
 
+# Deployed next to this file by exec_python (source: adf_agent/_jsoncodec.py)
+from _jsoncodec import dumps_indented as _dumps_indented, loads as _loads
+
 __all__ = [
     # Common standard libraries (directly available to user code)
     "json", "re", "sys", "Path", "Counter", "defaultdict",
@@ -37,15 +40,14 @@ def load_json(filename: str):
         raise FileNotFoundError(
             f"File not found: {filename}. Use list_dir() to see available files."
         )
-    return json.loads(filepath.read_text(encoding="utf-8"))
+    return _loads(filepath.read_text(encoding="utf-8"))
 
 
 def save_json(filename: str, data) -> None:
     """Save data as JSON to session directory"""
     filepath = session_dir / filename
-    filepath.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    # Serialized before the file is opened, so a failure leaves it untouched
+    filepath.write_text(_dumps_indented(data), encoding="utf-8")
     print(f"Saved to {filename}")
 
 
@@ -53,6 +55,5 @@ def pretty_print(data, max_items: int = 10) -> None:
     """Pretty print JSON data with truncation"""
     if isinstance(data, list) and len(data) > max_items:
         print(f"Showing first {max_items} of {len(data)} items:")
-        print(json.dumps(data[:max_items], indent=2, ensure_ascii=False))
-    else:
-        print(json.dumps(data, indent=2, ensure_ascii=False))
+        data = data[:max_items]
+    print(_dumps_indented(data))
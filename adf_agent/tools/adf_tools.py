@@ -7,12 +7,17 @@ All tools write data to the workspace/ directory to avoid placing large JSON int
 
 import json
 import functools
+import time
 
 from langchain.tools import tool, ToolRuntime
 
 from ..context import ADFAgentContext
 from .azure_adf_client import ADFClient
 
+# How long a definition read by adf_linked_service_get may stand in for the
+# GET in a following adf_linked_service_test
+_LINKED_SERVICE_REUSE_TTL = 30.0
+
 
 def require_adf_config(func):
     """Decorator: check if ADF configuration is complete"""
@@ -32,16 +37,29 @@ def require_adf_config(func):
 
 
 def _get_adf_client(runtime: ToolRuntime[ADFAgentContext]) -> ADFClient:
-    """Get ADF client instance"""
+    """Get ADF client instance
+
+    Reused across tool calls until the ADF target changes, so the client's
+    HTTP session keeps its connections to ARM alive.
+    """
     config = runtime.context.adf_config
-    credential = runtime.context.credential
+    cache = runtime.context.cache
+
+    cached = cache.get("adf_client")
+    if cached is not None:
+        cached_config, client = cached
+        if cached_config is config:
+            return client
+        client.close()
 
-    return ADFClient(
+    client = ADFClient(
         resource_group=config.resource_group,
         factory_name=config.factory_name,
         subscription_id=config.subscription_id,
-        credential=credential,
+        credential=runtime.context.credential,
     )
+    cache["adf_client"] = (config, client)
+    return client
 
 
 # === Pipeline Tools ===
@@ -60,7 +78,7 @@ def adf_pipeline_list(runtime: ToolRuntime[ADFAgentContext]) -> str:
         List of pipeline names, with individual files saved to pipelines/
     """
     try:
-        cache = runtime.context._cache
+        cache = runtime.context.cache
         if "pipelines" in cache:
             names, pipelines_dir = cache["pipelines"]
         else:
@@ -128,30 +146,44 @@ def adf_linked_service_list(runtime: ToolRuntime[ADFAgentContext]) -> str:
     """
     List all linked services in the Azure Data Factory.
 
-    Returns a lightweight summary of all linked services (name + type).
-    Use adf_linked_service_get to retrieve full details of a specific service.
+    Returns a lightweight summary of all linked services (name + type) and
+    saves each full definition to linked_services/{name}.json.
+    Use read_file to explore individual definitions.
     Results are cached for the session.
 
     Returns:
-        List of linked service names with their types
+        List of linked service names with their types, with individual files saved to linked_services/
     """
     try:
-        cache = runtime.context._cache
-        if "linked_services" not in cache:
+        cache = runtime.context.cache
+        if "linked_services" in cache:
+            services, services_dir = cache["linked_services"]
+        else:
             client = _get_adf_client(runtime)
-            cache["linked_services"] = client.list_linked_services()
+            services = client.list_linked_services()
+            services_dir = runtime.context.session_dir / "linked_services"
+            services_dir.mkdir(parents=True, exist_ok=True)
+
+            # Full definitions via the ARM batch endpoint: one call per 20 services
+            definitions = client.get_linked_services_details([s["name"] for s in services])
+            for s, definition in zip(services, definitions):
+                (services_dir / f"{s['name']}.json").write_text(
+                    json.dumps(definition, indent=2, ensure_ascii=False), encoding="utf-8"
+                )
+
+            cache["linked_services"] = (services, services_dir)
 
-        services = cache["linked_services"]
         summary_lines = [f"  - {s['name']} ({s['type']})" for s in services]
 
         return f"""[OK]
 
-Found {len(services)} linked services.
+Found {len(services)} linked services. Each saved to {services_dir}/{{name}}.json
 
 {chr(10).join(summary_lines[:50])}
 {"  ... and more" if len(services) > 50 else ""}
 
-Use adf_linked_service_get(name) to get full details of a specific service.
+Use read_file("{services_dir}/<name>.json") to explore a specific linked service,
+or adf_linked_service_get(name) to get its full details directly.
 """
 
     except Exception as e:
@@ -175,6 +207,9 @@ def adf_linked_service_get(name: str, runtime: ToolRuntime[ADFAgentContext]) ->
     try:
         client = _get_adf_client(runtime)
         service = client.get_linked_service(name)
+        # Handed to an immediately following adf_linked_service_test (saves a GET)
+        defs = runtime.context.cache.setdefault("linked_service_defs", {})
+        defs[(client.factory_url, name)] = (time.monotonic(), service)
         return f"[OK]\n\n{json.dumps(service, indent=2, ensure_ascii=False)}"
 
     except Exception as e:
@@ -199,8 +234,14 @@ def adf_linked_service_test(name: str, runtime: ToolRuntime[ADFAgentContext]) ->
     try:
         client = _get_adf_client(runtime)
 
-        # Execute connection test
-        result = client.test_linked_service(name)
+        # Execute connection test, reusing a definition adf_linked_service_get
+        # read moments ago (once only; older or re-tests fetch it fresh)
+        defs = runtime.context.cache.get("linked_service_defs", {})
+        entry = defs.pop((client.factory_url, name), None)
+        linked_service = None
+        if entry is not None and time.monotonic() - entry[0] < _LINKED_SERVICE_REUSE_TTL:
+            linked_service = entry[1]
+        result = client.test_linked_service(name, linked_service)
 
         if result.get("succeeded"):
             return f"""[OK]
@@ -251,7 +292,7 @@ def adf_dataset_list(runtime: ToolRuntime[ADFAgentContext]) -> str:
         List of datasets with linked service info, saved to datasets.json
     """
     try:
-        cache = runtime.context._cache
+        cache = runtime.context.cache
         if "datasets" in cache:
             datasets, datasets_path = cache["datasets"]
         else:
@@ -302,7 +343,7 @@ def adf_integration_runtime_list(runtime: ToolRuntime[ADFAgentContext]) -> str:
         List of IR names with types
     """
     try:
-        cache = runtime.context._cache
+        cache = runtime.context.cache
         if "integration_runtimes" not in cache:
             client = _get_adf_client(runtime)
             cache["integration_runtimes"] = client.list_integration_runtimes()
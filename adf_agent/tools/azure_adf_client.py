@@ -5,12 +5,104 @@ Simplified ADF operations wrapper using DefaultAzureCredential authentication.
 Does not depend on external azure_tools package.
 """
 
+import copy
+import json
+import threading
 import time
+from concurrent.futures import Future
+from functools import cached_property
+from typing import TYPE_CHECKING, Callable, List, Dict, Optional, Tuple
+
 import requests
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader
+from urllib3.util.retry import Retry
 
+from azure.core.credentials import AccessToken
 from azure.identity import DefaultAzureCredential
-from azure.mgmt.datafactory import DataFactoryManagementClient
+
+from .._jsoncodec import dumps as _json_dumps, loads as _json_loads
+
+if TYPE_CHECKING:
+    from azure.mgmt.datafactory import DataFactoryManagementClient
+
+API_VERSION = "2018-06-01"
+
+_ARM_ENDPOINT = "https://management.azure.com"
+_ARM_SCOPE = f"{_ARM_ENDPOINT}/.default"
+_ARM_BATCH_URL = f"{_ARM_ENDPOINT}/batch?api-version=2020-06-01"
+# ARM accepts at most 20 sub-requests per batch
+_ARM_BATCH_SIZE = 20
+# How long a getStatus response is reused by sibling IR helpers
+_IR_STATUS_TTL = 5.0
+# Refresh the bearer token this many seconds before it expires
+_TOKEN_REFRESH_MARGIN = 300
+# Transient statuses retried for idempotent requests (GET)
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+# POSTs are only retried when ARM rejected them without processing
+_POST_RETRY_STATUSES = frozenset((429, 503))
+# Upper bound for any single retry sleep (backoff or Retry-After), seconds
+_RETRY_SLEEP_MAX = 30.0
+
+
+class _ARMRetry(Retry):
+    """urllib3 Retry tuned for ARM
+
+    GET (and other idempotent methods) is retried on connection/read errors
+    and transient 5xx/429. POST stays outside allowed_methods, so urllib3
+    never replays it after a read error; it is only retried on 429/503 where
+    ARM rejected the call unprocessed. Retry-After is honored but capped.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return bool(self.total) and status_code in _POST_RETRY_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def get_backoff_time(self) -> float:
+        """Exponential backoff, capped (urllib3 1.26 has no backoff_max argument)"""
+        return min(super().get_backoff_time(), _RETRY_SLEEP_MAX)
+
+    def parse_retry_after(self, retry_after: str) -> float:
+        """Seconds from a Retry-After value (delta-seconds or HTTP-date), capped"""
+        return min(super().parse_retry_after(retry_after), _RETRY_SLEEP_MAX)
+
+
+def _poll_delay(response: requests.Response, default: float = 1.0) -> float:
+    """Seconds to wait before polling an accepted (202) ARM operation again
+
+    Retry-After is parsed and capped as _ARMRetry does; a missing or
+    malformed header falls back to default.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return _ARMRetry(0).parse_retry_after(retry_after)
+        except InvalidHeader:
+            pass
+    return default
+
+
+def _create_session() -> requests.Session:
+    """Create a pooled HTTP session for ARM REST calls.
+
+    All REST calls go to management.azure.com, so one pool keeps the TLS
+    connection alive between calls. Retries follow _ARMRetry; the final
+    response is still left to raise_for_status().
+    """
+    session = requests.Session()
+    retries = _ARMRetry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=sorted(_RETRY_STATUSES),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Content-Type"] = "application/json"
+    return session
 
 
 class ADFClient:
@@ -38,23 +130,73 @@ class ADFClient:
         """
         self.resource_group = resource_group
         self.factory_name = factory_name
-        self.credential = credential or DefaultAzureCredential()
 
-        # Get subscription_id
+        # credential / subscription_id / client are created on first use;
+        # values passed in here shadow the lazy properties
+        if credential is not None:
+            self.credential = credential
         if subscription_id:
             self.subscription_id = subscription_id
-        else:
-            self.subscription_id = self._get_subscription_id()
 
-        # Create DataFactory client
-        self.client = DataFactoryManagementClient(
+        # Cache token (and the headers built from it) until near expiry
+        self._token: Optional[AccessToken] = None
+        self._auth_headers: Dict[str, str] = {}
+        self._token_lock = threading.Lock()
+
+        # Short-lived IR getStatus cache: {name: (monotonic timestamp, status)}
+        self._ir_status_cache: Dict[str, Tuple[float, Dict]] = {}
+
+        # Identical requests in flight at the same time share one call: {url: Future}
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Shared HTTP session for REST calls (keep-alive connection pool)
+        self._session = _create_session()
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections"""
+        self._session.close()
+
+    def __enter__(self) -> "ADFClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @cached_property
+    def credential(self) -> DefaultAzureCredential:
+        """Lazy-load DefaultAzureCredential"""
+        return DefaultAzureCredential()
+
+    @cached_property
+    def subscription_id(self) -> str:
+        """Lazy-resolve the subscription ID"""
+        return self._get_subscription_id()
+
+    @cached_property
+    def _factory_path(self) -> str:
+        """ARM path of the factory, relative to management.azure.com"""
+        return (
+            f"/subscriptions/{self.subscription_id}"
+            f"/resourcegroups/{self.resource_group}"
+            f"/providers/Microsoft.DataFactory/factories/{self.factory_name}"
+        )
+
+    @cached_property
+    def factory_url(self) -> str:
+        """Absolute factory URL that REST paths are appended to"""
+        return _ARM_ENDPOINT + self._factory_path
+
+    @cached_property
+    def client(self) -> "DataFactoryManagementClient":
+        """Lazy-create the DataFactory management client (SDK operations only)"""
+        from azure.mgmt.datafactory import DataFactoryManagementClient
+
+        return DataFactoryManagementClient(
             credential=self.credential,
             subscription_id=self.subscription_id,
         )
 
-        # Cache token
-        self._token = None
-
     # === Pipeline Operations ===
 
     def list_pipelines(self):
@@ -91,27 +233,24 @@ class ADFClient:
     def _get_subscription_id(self) -> str:
         """Get subscription ID (from environment variable first, then Azure CLI default subscription)"""
         import os
-        import subprocess
-        import json
 
         # 1. Read from environment variable first
         sub_id = os.getenv("AZURE_SUBSCRIPTION_ID") or os.getenv("ADF_SUBSCRIPTION_ID")
         if sub_id:
             return sub_id
 
-        # 2. Get default subscription from Azure CLI
+        # 2. Azure CLI default subscription, read from its profile file
+        #    (same answer as `az account show`, without starting the CLI)
+        config_dir = os.getenv("AZURE_CONFIG_DIR") or os.path.expanduser("~/.azure")
         try:
-            result = subprocess.run(
-                ["az", "account", "show", "--query", "id", "-o", "tsv"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            sub_id = result.stdout.strip()
-            if sub_id:
-                return sub_id
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
+            # The CLI writes this file with a UTF-8 BOM
+            with open(os.path.join(config_dir, "azureProfile.json"), encoding="utf-8-sig") as f:
+                profile = json.load(f)
+        except (OSError, ValueError):
+            profile = {}
+        for sub in profile.get("subscriptions", []):
+            if sub.get("isDefault") and sub.get("id"):
+                return sub["id"]
 
         # 3. Fall back to SDK method (for backward compatibility)
         from azure.mgmt.resource import SubscriptionClient
@@ -122,9 +261,104 @@ class ADFClient:
         raise ValueError("No Azure subscription found")
 
     def _get_token(self) -> str:
-        """Get Bearer Token (for REST API calls)"""
-        token = self.credential.get_token("https://management.azure.com/.default")
-        return token.token
+        """Get Bearer Token (for REST API calls), cached until near expiry"""
+        token = self._token
+        if token is not None and token.expires_on - time.time() > _TOKEN_REFRESH_MARGIN:
+            return token.token
+
+        with self._token_lock:
+            token = self._token
+            if token is None or token.expires_on - time.time() <= _TOKEN_REFRESH_MARGIN:
+                token = self.credential.get_token(_ARM_SCOPE)
+                self._token = token
+                self._auth_headers = {"Authorization": f"Bearer {token.token}"}
+            return token.token
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Get request headers carrying the current Bearer Token"""
+        self._get_token()
+        return self._auth_headers
+
+    def _batch_get(self, relative_urls: List[str], chunk: int = _ARM_BATCH_SIZE) -> List[Dict]:
+        """
+        GET several ARM resources through the ARM batch endpoint
+
+        Args:
+            relative_urls: Resource URLs relative to management.azure.com
+            chunk: Sub-requests per batch call
+
+        Returns:
+            Response bodies, in the order of relative_urls
+
+        Raises:
+            requests.HTTPError: If the batch call or any sub-request fails
+        """
+        results: List[Dict] = []
+        for start in range(0, len(relative_urls), chunk):
+            batch = relative_urls[start:start + chunk]
+            body = {
+                "requests": [
+                    {"httpMethod": "GET", "url": url, "name": str(i)}
+                    for i, url in enumerate(batch)
+                ]
+            }
+            response = self._session.post(
+                _ARM_BATCH_URL, headers=self._get_headers(), data=_json_dumps(body)
+            )
+            response.raise_for_status()
+
+            # Large batches may be processed asynchronously: poll Location
+            while response.status_code == 202:
+                time.sleep(_poll_delay(response))
+                response = self._session.get(
+                    response.headers["Location"], headers=self._get_headers()
+                )
+                response.raise_for_status()
+
+            by_name = {r["name"]: r for r in _json_loads(response.content)["responses"]}
+            for i, url in enumerate(batch):
+                sub = by_name[str(i)]
+                if sub["httpStatusCode"] >= 400:
+                    error = (sub.get("content") or {}).get("error", {})
+                    raise requests.HTTPError(
+                        f"{sub['httpStatusCode']} for {url}: "
+                        f"{error.get('message', 'batch sub-request failed')}",
+                        response=response,
+                    )
+                results.append(sub.get("content") or {})
+        return results
+
+    def _dedupe(self, key: str, fetch: Callable[[], Dict]) -> Dict:
+        """
+        Run fetch(), or wait for the identical call another thread already started
+
+        Args:
+            key: Request identity (the URL)
+            fetch: Performs the request and returns the parsed response
+
+        Returns:
+            The response shared by all concurrent callers of the same key
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
 
     # === Dataset Operations ===
 
@@ -140,12 +374,13 @@ class ADFClient:
             resource_group_name=self.resource_group,
             factory_name=self.factory_name,
         ):
-            d = ds.as_dict()
-            ls_ref = d.get("properties", {}).get("linked_service_name", {})
+            # Read fields off the typed model; as_dict() would copy the whole payload
+            props = ds.properties
+            ls_ref = getattr(props, "linked_service_name", None)
             result.append({
-                "name": d.get("name", "unknown"),
-                "type": d.get("properties", {}).get("type", "unknown"),
-                "linked_service": ls_ref.get("reference_name", "unknown"),
+                "name": ds.name or "unknown",
+                "type": getattr(props, "type", None) or "unknown",
+                "linked_service": getattr(ls_ref, "reference_name", None) or "unknown",
             })
         return result
 
@@ -163,10 +398,9 @@ class ADFClient:
             resource_group_name=self.resource_group,
             factory_name=self.factory_name,
         ):
-            d = s.as_dict()
             result.append({
-                "name": d.get("name", "unknown"),
-                "type": d.get("properties", {}).get("type", "unknown"),
+                "name": s.name or "unknown",
+                "type": getattr(s.properties, "type", None) or "unknown",
             })
         return result
 
@@ -181,54 +415,61 @@ class ADFClient:
             Linked Service definition dictionary
         """
         # Use REST API to get full details (including typeProperties)
-        api_url = (
-            f"https://management.azure.com/subscriptions/{self.subscription_id}"
-            f"/resourcegroups/{self.resource_group}"
-            f"/providers/Microsoft.DataFactory/factories/{self.factory_name}"
-            f"/linkedservices/{name}?api-version=2018-06-01"
-        )
+        api_url = f"{self.factory_url}/linkedservices/{name}?api-version={API_VERSION}"
 
-        headers = {
-            "Authorization": f"Bearer {self._get_token()}",
-            "Content-Type": "application/json",
-        }
+        def fetch() -> Dict:
+            response = self._session.get(api_url, headers=self._get_headers())
+            response.raise_for_status()
+            return _json_loads(response.content)
 
-        response = requests.get(api_url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return self._dedupe(api_url, fetch)
 
-    def test_linked_service(self, name: str) -> Dict:
+    def test_linked_service(self, name: str, linked_service: Optional[Dict] = None) -> Dict:
         """
         Test Linked Service connection
 
         Args:
             name: Linked Service name
+            linked_service: Definition from get_linked_service (optional, fetched if omitted)
 
         Returns:
             Test result dictionary containing succeeded field
         """
         # Get linked service details
-        linked_service = self.get_linked_service(name)
+        if linked_service is None:
+            linked_service = self.get_linked_service(name)
 
         # Build request body
         body = {"linkedService": linked_service}
 
         # Call test API
-        api_url = (
-            f"https://management.azure.com/subscriptions/{self.subscription_id}"
-            f"/resourcegroups/{self.resource_group}"
-            f"/providers/Microsoft.DataFactory/factories/{self.factory_name}"
-            f"/testConnectivity?api-version=2018-06-01"
+        api_url = f"{self.factory_url}/testConnectivity?api-version={API_VERSION}"
+
+        response = self._session.post(
+            api_url, headers=self._get_headers(), data=_json_dumps(body)
         )
+        response.raise_for_status()
+        return _json_loads(response.content)
 
-        headers = {
-            "Authorization": f"Bearer {self._get_token()}",
-            "Content-Type": "application/json",
-        }
+    def get_linked_services_details(self, names: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Get full definitions of several Linked Services
 
-        response = requests.post(api_url, headers=headers, json=body)
-        response.raise_for_status()
-        return response.json()
+        Fetched through the ARM batch endpoint: one request per 20 services.
+
+        Args:
+            names: Linked Service names (default: all linked services)
+
+        Returns:
+            Linked Service definition dictionaries, in the order of names
+        """
+        if names is None:
+            names = [s["name"] for s in self.list_linked_services()]
+
+        prefix = self._factory_path
+        return self._batch_get(
+            [f"{prefix}/linkedservices/{name}?api-version={API_VERSION}" for name in names]
+        )
 
     # === Integration Runtime Operations ===
 
@@ -244,10 +485,9 @@ class ADFClient:
             resource_group_name=self.resource_group,
             factory_name=self.factory_name,
         ):
-            d = ir.as_dict()
             result.append({
-                "name": d.get("name", "unknown"),
-                "type": d.get("properties", {}).get("type", "unknown"),
+                "name": ir.name or "unknown",
+                "type": getattr(ir.properties, "type", None) or "unknown",
             })
         return result
 
@@ -259,23 +499,33 @@ class ADFClient:
             name: Integration Runtime name
 
         Returns:
-            IR status dictionary
+            IR status dictionary (the caller's own copy)
         """
+        return copy.deepcopy(self._get_ir_status(name))
+
+    def _invalidate_ir_status(self, name: str) -> None:
+        """Drop the cached status of an IR (call after anything that changes its state)"""
+        self._ir_status_cache.pop(name, None)
+
+    def _get_ir_status(self, name: str) -> Dict:
+        """IR status shared with the short-lived cache; callers must not modify it"""
+        cached = self._ir_status_cache.get(name)
+        if cached is not None and time.monotonic() - cached[0] < _IR_STATUS_TTL:
+            return cached[1]
+
         api_url = (
-            f"https://management.azure.com/subscriptions/{self.subscription_id}"
-            f"/resourcegroups/{self.resource_group}"
-            f"/providers/Microsoft.DataFactory/factories/{self.factory_name}"
-            f"/integrationruntimes/{name}/getStatus?api-version=2018-06-01"
+            f"{self.factory_url}/integrationruntimes/{name}"
+            f"/getStatus?api-version={API_VERSION}"
         )
 
-        headers = {
-            "Authorization": f"Bearer {self._get_token()}",
-            "Content-Type": "application/json",
-        }
+        def fetch() -> Dict:
+            response = self._session.post(api_url, headers=self._get_headers())
+            response.raise_for_status()
+            status = _json_loads(response.content)
+            self._ir_status_cache[name] = (time.monotonic(), status)
+            return status
 
-        response = requests.post(api_url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return self._dedupe(api_url, fetch)
 
     def get_integration_runtime_type(self, name: str) -> str:
         """
@@ -287,7 +537,7 @@ class ADFClient:
         Returns:
             IR type (e.g., "Managed", "SelfHosted")
         """
-        status = self.get_integration_runtime_status(name)
+        status = self._get_ir_status(name)
         ir_type = status.get("properties", {}).get("type")
         if not ir_type:
             raise ValueError(f"Integration Runtime type not found for {name}")
@@ -303,13 +553,11 @@ class ADFClient:
         Returns:
             True if enabled
         """
-        status = self.get_integration_runtime_status(name)
-        interactive_status = (
-            status.get("properties", {})
-            .get("typeProperties", {})
-            .get("interactiveQuery", {})
-            .get("status")
-        )
+        status = self._get_ir_status(name)
+        try:
+            interactive_status = status["properties"]["typeProperties"]["interactiveQuery"]["status"]
+        except (KeyError, TypeError):
+            return False
         return interactive_status == "Enabled"
 
     def enable_interactive_authoring(self, name: str, minutes: int = 10) -> None:
@@ -323,7 +571,8 @@ class ADFClient:
         Raises:
             ValueError: If IR type is not Managed
         """
-        # Check IR type
+        # Check IR type (fresh status; the enabled check below reuses it)
+        self._invalidate_ir_status(name)
         ir_type = self.get_integration_runtime_type(name)
         if ir_type != "Managed":
             raise ValueError(
@@ -337,30 +586,35 @@ class ADFClient:
 
         # Call enable API
         api_url = (
-            f"https://management.azure.com/subscriptions/{self.subscription_id}"
-            f"/resourcegroups/{self.resource_group}"
-            f"/providers/Microsoft.DataFactory/factories/{self.factory_name}"
-            f"/integrationruntimes/{name}/enableInteractiveQuery?api-version=2018-06-01"
+            f"{self.factory_url}/integrationruntimes/{name}"
+            f"/enableInteractiveQuery?api-version={API_VERSION}"
         )
 
-        headers = {
-            "Authorization": f"Bearer {self._get_token()}",
-            "Content-Type": "application/json",
-        }
-
         body = {"autoTerminationMinutes": minutes}
 
-        response = requests.post(api_url, headers=headers, json=body)
+        try:
+            response = self._session.post(
+                api_url, headers=self._get_headers(), data=_json_dumps(body)
+            )
+        finally:
+            # The IR state may have changed even if the call failed
+            self._invalidate_ir_status(name)
         response.raise_for_status()
 
-        # Wait for enablement to complete
+        # Wait for enablement to complete, backing off 2s -> 4s -> ... -> 30s
         max_wait = 180  # Wait up to 3 minutes
-        waited = 0
-        while waited < max_wait:
+        deadline = time.monotonic() + max_wait
+        delay = 2
+        while True:
+            # Every poll must see a fresh status, not the cached one
+            self._invalidate_ir_status(name)
             if self.is_interactive_authoring_enabled(name):
                 return
-            time.sleep(10)
-            waited += 10
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 30)
 
         raise TimeoutError(
             f"Interactive authoring not enabled after {max_wait} seconds"
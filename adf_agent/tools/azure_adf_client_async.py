@@ -0,0 +1,280 @@
+"""
+Azure Data Factory Async Client
+
+asyncio mirror of ADFClient for callers that issue many ADF operations
+concurrently. REST calls go through one aiohttp session; management SDK
+list operations run in a worker thread because the SDK client is sync.
+
+Requires aiohttp (install the "async" extra).
+"""
+
+import asyncio
+import time
+from typing import Any, List, Dict, Optional
+
+import aiohttp
+from azure.core.credentials import AccessToken
+from azure.identity.aio import DefaultAzureCredential
+
+from .azure_adf_client import (
+    API_VERSION,
+    ADFClient,
+    _ARM_SCOPE,
+    _POST_RETRY_STATUSES,
+    _RETRY_SLEEP_MAX,
+    _RETRY_STATUSES,
+    _TOKEN_REFRESH_MARGIN,
+)
+
+# Same budget as the sync session's urllib3 Retry
+_MAX_RETRIES = 5
+_BACKOFF_FACTOR = 0.5
+
+
+class _SyncCredentialBridge:
+    """Sync TokenCredential backed by the async credential
+
+    Lets the sync management SDK (run in worker threads via asyncio.to_thread)
+    authenticate with the same identity as the async REST calls.
+    """
+
+    def __init__(self, credential: Any, loop: asyncio.AbstractEventLoop):
+        self._credential = credential
+        self._loop = loop
+
+    def get_token(self, *scopes: str, **kwargs) -> AccessToken:
+        return asyncio.run_coroutine_threadsafe(
+            self._credential.get_token(*scopes, **kwargs), self._loop
+        ).result()
+
+
+class AsyncADFClient:
+    """
+    Azure Data Factory Async Client
+
+    Usage:
+        async with AsyncADFClient(rg, factory) as client:
+            statuses = await asyncio.gather(
+                *(client.get_integration_runtime_status(n) for n in names)
+            )
+    """
+
+    def __init__(
+        self,
+        resource_group: str,
+        factory_name: str,
+        subscription_id: Optional[str] = None,
+        credential: Optional[DefaultAzureCredential] = None,
+    ):
+        """
+        Initialize async ADF client
+
+        Args:
+            resource_group: Azure resource group name
+            factory_name: ADF factory name
+            subscription_id: Subscription ID (optional, auto-detected)
+            credential: Async Azure credential (optional, auto-creates one)
+        """
+        self.resource_group = resource_group
+        self.factory_name = factory_name
+        self._subscription_id = subscription_id
+        # Only a credential created here is closed by close(); a passed-in one
+        # stays owned by the caller
+        self._owns_credential = credential is None
+        self.credential = credential or DefaultAzureCredential()
+
+        # Sync client for management SDK operations and the subscription lookup;
+        # built on first use, inside the event loop (see _get_sync)
+        self._sync: Optional[ADFClient] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._token: Optional[AccessToken] = None
+        self._token_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncADFClient":
+        self._get_session()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP session, the sync client and a self-created credential"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._sync is not None:
+            self._sync.close()
+            self._sync = None
+        if self._owns_credential:
+            await self.credential.close()
+
+    # === Internal Methods ===
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session (created on first use)"""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=60),
+                headers={"Content-Type": "application/json"},
+            )
+        return self._session
+
+    def _get_sync(self) -> ADFClient:
+        """Get the sync helper client, authenticating through this client's credential"""
+        if self._sync is None:
+            self._sync = ADFClient(
+                self.resource_group,
+                self.factory_name,
+                self._subscription_id,
+                credential=_SyncCredentialBridge(self.credential, asyncio.get_running_loop()),
+            )
+        return self._sync
+
+    async def _in_thread(self, method: str, *args):
+        """Run a blocking sync-client method off the event loop"""
+        return await asyncio.to_thread(getattr(self._get_sync(), method), *args)
+
+    async def _get_factory_url(self) -> str:
+        """Factory URL; the first call resolves the subscription off the event loop"""
+        sync = self._get_sync()
+        if "factory_url" in sync.__dict__:
+            return sync.factory_url
+        return await asyncio.to_thread(lambda: sync.factory_url)
+
+    async def _get_headers(self) -> Dict[str, str]:
+        """Get request headers with a Bearer Token cached until near expiry"""
+        async with self._token_lock:
+            token = self._token
+            if token is None or token.expires_on - time.time() <= _TOKEN_REFRESH_MARGIN:
+                token = await self.credential.get_token(_ARM_SCOPE)
+                self._token = token
+        return {"Authorization": f"Bearer {token.token}"}
+
+    async def _request(self, method: str, path: str, body: Optional[Dict] = None) -> Dict:
+        """
+        Send a REST request (path relative to the factory URL) and return the JSON response
+
+        Mirrors the sync session's retry policy: GET is retried on 429/5xx,
+        POST only on 429/503 (rejected unprocessed). Retry-After is honored,
+        and every sleep is capped.
+        """
+        url = await self._get_factory_url() + path
+        retry_statuses = _POST_RETRY_STATUSES if method == "POST" else _RETRY_STATUSES
+        attempt = 0
+        while True:
+            async with self._get_session().request(
+                method, url, headers=await self._get_headers(), json=body
+            ) as response:
+                if response.status not in retry_statuses or attempt >= _MAX_RETRIES:
+                    response.raise_for_status()
+                    return await response.json()
+                retry_after = response.headers.get("Retry-After", "")
+
+            delay = _BACKOFF_FACTOR * (2 ** attempt)
+            if retry_after.isdigit():
+                delay = int(retry_after)
+            await asyncio.sleep(min(delay, _RETRY_SLEEP_MAX))
+            attempt += 1
+
+    # === Pipeline / Dataset / Linked Service / IR listing (management SDK) ===
+
+    async def get_pipeline(self, name: str) -> Dict:
+        """Get Pipeline details"""
+        return await self._in_thread("get_pipeline", name)
+
+    async def list_datasets(self) -> List[Dict[str, str]]:
+        """List all Datasets (lightweight summary)"""
+        return await self._in_thread("list_datasets")
+
+    async def list_linked_services(self) -> List[Dict[str, str]]:
+        """List all Linked Services (lightweight summary)"""
+        return await self._in_thread("list_linked_services")
+
+    async def list_integration_runtimes(self) -> List[Dict[str, str]]:
+        """List all Integration Runtimes (lightweight summary)"""
+        return await self._in_thread("list_integration_runtimes")
+
+    # === Linked Service Operations ===
+
+    async def get_linked_service(self, name: str) -> Dict:
+        """Get Linked Service details"""
+        return await self._request(
+            "GET", f"/linkedservices/{name}?api-version={API_VERSION}"
+        )
+
+    async def test_linked_service(self, name: str, linked_service: Optional[Dict] = None) -> Dict:
+        """Test Linked Service connection (fetches the definition if not given)"""
+        if linked_service is None:
+            linked_service = await self.get_linked_service(name)
+        return await self._request(
+            "POST",
+            f"/testConnectivity?api-version={API_VERSION}",
+            {"linkedService": linked_service},
+        )
+
+    # === Integration Runtime Operations ===
+
+    async def get_integration_runtime_status(self, name: str) -> Dict:
+        """Get Integration Runtime status"""
+        return await self._request(
+            "POST",
+            f"/integrationruntimes/{name}/getStatus?api-version={API_VERSION}",
+        )
+
+    async def get_integration_runtime_type(self, name: str) -> str:
+        """Get Integration Runtime type"""
+        status = await self.get_integration_runtime_status(name)
+        ir_type = status.get("properties", {}).get("type")
+        if not ir_type:
+            raise ValueError(f"Integration Runtime type not found for {name}")
+        return ir_type
+
+    async def is_interactive_authoring_enabled(self, name: str) -> bool:
+        """Check if Interactive Authoring is enabled"""
+        status = await self.get_integration_runtime_status(name)
+        try:
+            interactive_status = status["properties"]["typeProperties"]["interactiveQuery"]["status"]
+        except (KeyError, TypeError):
+            return False
+        return interactive_status == "Enabled"
+
+    async def enable_interactive_authoring(self, name: str, minutes: int = 10) -> None:
+        """
+        Enable Interactive Authoring
+
+        Raises:
+            ValueError: If IR type is not Managed
+            TimeoutError: If not enabled within 3 minutes
+        """
+        ir_type = await self.get_integration_runtime_type(name)
+        if ir_type != "Managed":
+            raise ValueError(
+                f"Interactive authoring only supported for Managed IR. "
+                f"Current type: {ir_type}"
+            )
+
+        if await self.is_interactive_authoring_enabled(name):
+            return
+
+        await self._request(
+            "POST",
+            f"/integrationruntimes/{name}"
+            f"/enableInteractiveQuery?api-version={API_VERSION}",
+            {"autoTerminationMinutes": minutes},
+        )
+
+        max_wait = 180
+        deadline = time.monotonic() + max_wait
+        delay = 2
+        while True:
+            if await self.is_interactive_authoring_enabled(name):
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, 30)
+
+        raise TimeoutError(
+            f"Interactive authoring not enabled after {max_wait} seconds"
+        )
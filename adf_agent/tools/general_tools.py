@@ -259,14 +259,19 @@ def list_dir(path: str, runtime: ToolRuntime[ADFAgentContext]) -> str:
         return f"[FAILED] {str(e)}"
 
 
-_EXEC_RUNTIME_SRC = Path(__file__).with_name("_exec_runtime.py")
+# Runtime helper modules copied into session_dir (_exec_runtime imports _jsoncodec)
+_EXEC_RUNTIME_SRCS = (
+    Path(__file__).with_name("_exec_runtime.py"),
+    Path(__file__).parent.parent / "_jsoncodec.py",
+)
 
 
 def _ensure_runtime(session_dir: Path) -> None:
-    """Deploy _exec_runtime.py to session_dir on first call, skip on subsequent calls."""
-    dest = session_dir / "_exec_runtime.py"
-    if not dest.exists():
-        dest.write_text(_EXEC_RUNTIME_SRC.read_text(encoding="utf-8"), encoding="utf-8")
+    """Deploy the runtime helpers to session_dir on first call, skip on subsequent calls."""
+    for src in _EXEC_RUNTIME_SRCS:
+        dest = session_dir / src.name
+        if not dest.exists():
+            dest.write_text(src.read_text(encoding="utf-8"), encoding="utf-8")
 
 
 @tool
@@ -0,0 +1,43 @@
+import json
+from types import SimpleNamespace
+
+from adf_agent.context import ADFAgentContext, ADFConfig
+from adf_agent.tools.adf_tools import adf_linked_service_list
+
+
+class _Client:
+    """ADFClient stand-in for the linked service tools"""
+
+    def __init__(self):
+        self.detail_calls: list[list[str]] = []
+
+    def list_linked_services(self):
+        return [{"name": "blob", "type": "AzureBlobStorage"}, {"name": "sql", "type": "SqlServer"}]
+
+    def get_linked_services_details(self, names):
+        self.detail_calls.append(names)
+        return [{"name": name, "properties": {}} for name in names]
+
+
+def _runtime(tmp_path, client) -> SimpleNamespace:
+    config = ADFConfig(resource_group="rg", factory_name="factory")
+    context = ADFAgentContext(working_directory=tmp_path, adf_config=config)
+    context.cache["adf_client"] = (config, client)
+    return SimpleNamespace(context=context)
+
+
+def test_linked_service_list_saves_each_definition(tmp_path):
+    client = _Client()
+    runtime = _runtime(tmp_path, client)
+
+    result = adf_linked_service_list.func(runtime=runtime)
+    assert result.startswith("[OK]")
+    assert "blob (AzureBlobStorage)" in result
+
+    services_dir = runtime.context.session_dir / "linked_services"
+    assert json.loads((services_dir / "sql.json").read_text()) == {"name": "sql", "properties": {}}
+    assert client.detail_calls == [["blob", "sql"]]
+
+    # Cached for the session: no second round of requests
+    adf_linked_service_list.func(runtime=runtime)
+    assert len(client.detail_calls) == 1
@@ -0,0 +1,136 @@
+import email.utils
+import json
+import time
+
+import pytest
+import requests
+from azure.core.credentials import AccessToken
+
+from adf_agent.tools import azure_adf_client as mod
+from adf_agent.tools.azure_adf_client import ADFClient
+
+
+class _Credential:
+    def get_token(self, *scopes, **kwargs):
+        return AccessToken("token", int(time.time()) + 3600)
+
+
+class _Response:
+    def __init__(self, status_code=200, body=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = json.dumps(body).encode("utf-8")
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+
+class _Session:
+    """requests.Session stand-in: answers batch POSTs and replays canned GETs"""
+
+    def __init__(self, gets=()):
+        self.gets = list(gets)
+        self.batches: list[list[str]] = []
+
+    def post(self, url, headers=None, data=None):
+        urls = [r["url"] for r in json.loads(data)["requests"]]
+        self.batches.append(urls)
+        responses = [
+            {"name": str(i), "httpStatusCode": 200, "content": {"url": u}}
+            for i, u in reversed(list(enumerate(urls)))  # order is not guaranteed
+        ]
+        return _Response(200, {"responses": responses})
+
+    def get(self, url, headers=None):
+        return self.gets.pop(0)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays: list[float] = []
+    monkeypatch.setattr(mod.time, "sleep", delays.append)
+    return delays
+
+
+def _client(session) -> ADFClient:
+    client = ADFClient("rg", "factory", "sub", credential=_Credential())
+    client._session = session
+    return client
+
+
+def test_batch_get_chunks_and_keeps_request_order():
+    client = _client(_Session())
+    urls = [f"/r/{i}" for i in range(45)]
+
+    assert client._batch_get(urls) == [{"url": u} for u in urls]
+    assert [len(b) for b in client._session.batches] == [20, 20, 5]
+
+
+def test_batch_get_raises_for_a_failed_sub_request():
+    class FailingSession(_Session):
+        def post(self, url, headers=None, data=None):
+            error = {"error": {"message": "not found"}}
+            return _Response(200, {"responses": [
+                {"name": "0", "httpStatusCode": 404, "content": error},
+            ]})
+
+    with pytest.raises(requests.HTTPError, match="404 for /r/missing: not found"):
+        _client(FailingSession())._batch_get(["/r/missing"])
+
+
+@pytest.mark.parametrize("retry_after, expected", [
+    ("2", 2),
+    ("", 1.0),
+    ("soon", 1.0),
+    ("3600", mod._RETRY_SLEEP_MAX),
+])
+def test_accepted_batch_is_polled_after_retry_after(sleeps, retry_after, expected):
+    done = {"responses": [{"name": "0", "httpStatusCode": 200, "content": {"ok": 1}}]}
+
+    class AcceptedSession(_Session):
+        def post(self, url, headers=None, data=None):
+            return _Response(202, {}, {"Retry-After": retry_after, "Location": "https://poll"})
+
+    client = _client(AcceptedSession(gets=[_Response(200, done)]))
+    assert client._batch_get(["/r/0"]) == [{"ok": 1}]
+    assert sleeps == [expected]
+
+
+def test_http_date_retry_after_is_understood():
+    when = email.utils.formatdate(time.time() + 10, usegmt=True)
+    response = _Response(202, {}, {"Retry-After": when})
+
+    assert 8 <= mod._poll_delay(response) <= 10
+
+
+def test_linked_service_details_are_fetched_in_one_batch():
+    client = _client(_Session())
+    definitions = client.get_linked_services_details(["a", "b"])
+
+    prefix = client._factory_path
+    assert definitions == [
+        {"url": f"{prefix}/linkedservices/{name}?api-version={mod.API_VERSION}"}
+        for name in ("a", "b")
+    ]
+    assert len(client._session.batches) == 1
+
+
+def test_retry_sleeps_are_capped():
+    retry = mod._ARMRetry(total=20, backoff_factor=0.5)
+    for _ in range(12):
+        retry = retry.increment(method="GET", url="/r")
+
+    assert retry.get_backoff_time() == mod._RETRY_SLEEP_MAX
+    assert retry.parse_retry_after("3600") == mod._RETRY_SLEEP_MAX
+
+
+def test_post_is_only_retried_on_rejected_statuses():
+    retry = mod._ARMRetry(total=5, status_forcelist=sorted(mod._RETRY_STATUSES))
+
+    assert retry.is_retry("POST", 429) and retry.is_retry("POST", 503)
+    assert not retry.is_retry("POST", 500)
+    assert retry.is_retry("GET", 500)
@@ -0,0 +1,159 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from azure.core.credentials import AccessToken
+
+from adf_agent.tools import azure_adf_client_async as mod
+from adf_agent.tools.azure_adf_client_async import AsyncADFClient, _SyncCredentialBridge
+
+
+class _Credential:
+    """Async credential stand-in that records get_token/close calls"""
+
+    def __init__(self):
+        self.closed = False
+        self.scopes: list[tuple] = []
+
+    async def get_token(self, *scopes, **kwargs):
+        self.scopes.append(scopes)
+        return AccessToken("token", int(time.time()) + 3600)
+
+    async def close(self):
+        self.closed = True
+
+
+class _Response:
+    def __init__(self, status, body=None, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    async def json(self):
+        return self._body
+
+
+class _Session:
+    """aiohttp.ClientSession stand-in replaying canned responses"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls: list[tuple[str, str]] = []
+        self.closed = False
+
+    def request(self, method, url, headers=None, json=None):
+        self.calls.append((method, url))
+        return self.responses.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays: list[float] = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(mod.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def _client(responses) -> AsyncADFClient:
+    client = AsyncADFClient("rg", "factory", "sub", credential=_Credential())
+    client._session = _Session(responses)
+    client._sync = SimpleNamespace(factory_url="https://arm/factory", close=lambda: None)
+    return client
+
+
+def test_get_is_retried_on_transient_status(sleeps):
+    client = _client([
+        _Response(500),
+        _Response(429, headers={"Retry-After": "3"}),
+        _Response(200, {"ok": 1}),
+    ])
+    result = asyncio.run(client.get_linked_service("ls"))
+
+    assert result == {"ok": 1}
+    assert sleeps == [0.5, 3]
+    assert client._session.calls[0] == (
+        "GET", f"https://arm/factory/linkedservices/ls?api-version={mod.API_VERSION}"
+    )
+
+
+def test_post_is_only_retried_when_rejected_unprocessed(sleeps):
+    client = _client([_Response(503), _Response(500)])
+    with pytest.raises(RuntimeError, match="HTTP 500"):
+        asyncio.run(client.get_integration_runtime_status("ir"))
+
+    assert sleeps == [0.5]
+    assert [method for method, _ in client._session.calls] == ["POST", "POST"]
+
+
+def test_retry_after_is_capped_and_retries_are_bounded(sleeps):
+    responses = [_Response(429, headers={"Retry-After": "3600"}) for _ in range(mod._MAX_RETRIES + 1)]
+    client = _client(responses)
+    with pytest.raises(RuntimeError, match="HTTP 429"):
+        asyncio.run(client.get_linked_service("ls"))
+
+    assert sleeps == [mod._RETRY_SLEEP_MAX] * mod._MAX_RETRIES
+
+
+def test_close_keeps_a_passed_in_credential_open():
+    client = _client([])
+    session = client._session
+    asyncio.run(client.close())
+
+    assert session.closed
+    assert client._session is None and client._sync is None
+    assert not client.credential.closed
+
+
+def test_close_closes_a_self_created_credential(monkeypatch):
+    monkeypatch.setattr(mod, "DefaultAzureCredential", _Credential)
+    client = AsyncADFClient("rg", "factory", "sub")
+    asyncio.run(client.close())
+
+    assert client.credential.closed
+
+
+def test_sync_bridge_gets_tokens_from_the_async_credential():
+    credential = _Credential()
+
+    async def main():
+        bridge = _SyncCredentialBridge(credential, asyncio.get_running_loop())
+        # As the management SDK would: from a worker thread, not the loop thread
+        return await asyncio.to_thread(bridge.get_token, "scope")
+
+    token = asyncio.run(main())
+    assert token.token == "token"
+    assert credential.scopes == [("scope",)]
+
+
+def test_sync_client_authenticates_through_the_async_credential():
+    client = AsyncADFClient("rg", "factory", "sub", credential=_Credential())
+
+    async def main():
+        sync = client._get_sync()
+        assert sync is client._get_sync()
+        return sync
+
+    sync = asyncio.run(main())
+    assert isinstance(sync.credential, _SyncCredentialBridge)
+    assert sync.credential._credential is client.credential
+    assert sync.subscription_id == "sub"
@@ -0,0 +1,68 @@
+import pytest
+
+from adf_agent.stream import StreamEvent, coalesce_deltas
+
+
+def _text(content: str) -> StreamEvent:
+    return StreamEvent("text", {"content": content})
+
+
+class _Clock:
+    """Manually advanced stand-in for time.monotonic"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_fast_deltas_are_merged():
+    events = [_text("a"), _text("b"), _text("c"), StreamEvent("done", {})]
+    out = list(coalesce_deltas(iter(events), window=10.0, clock=_Clock()))
+    assert out == [_text("abc"), StreamEvent("done", {})]
+
+
+def test_run_is_flushed_once_the_window_elapses():
+    clock = _Clock()
+
+    def timed():
+        for chunk, at in (("a", 0.0), ("b", 0.01), ("c", 0.02), ("d", 0.03)):
+            clock.now = at
+            yield _text(chunk)
+
+    out = list(coalesce_deltas(timed(), window=0.016, clock=clock))
+    assert out == [_text("abc"), _text("d")]
+
+
+def test_newline_flushes_and_order_is_kept():
+    events = [_text("a\n"), StreamEvent("tool_call", {"id": "1"}), _text("b")]
+    out = list(coalesce_deltas(iter(events), window=10.0, clock=_Clock()))
+    assert out == events
+
+
+def test_upstream_error_is_raised_after_pending_text():
+    def failing():
+        yield _text("partial")
+        raise RuntimeError("boom")
+
+    stream = coalesce_deltas(failing(), window=10.0, clock=_Clock())
+    assert next(stream) == _text("partial")
+    with pytest.raises(RuntimeError, match="boom"):
+        next(stream)
+
+
+def test_early_stop_closes_the_upstream_generator():
+    closed = []
+
+    def source():
+        try:
+            yield StreamEvent("tool_call", {"id": "1"})
+            yield StreamEvent("tool_call", {"id": "2"})
+        finally:
+            closed.append(True)
+
+    stream = coalesce_deltas(source(), clock=_Clock())
+    assert next(stream) == StreamEvent("tool_call", {"id": "1"})
+    stream.close()
+    assert closed == [True]
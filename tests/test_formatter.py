@@ -0,0 +1,13 @@
+from adf_agent.stream import ContentType, ToolResultFormatter
+
+
+def test_small_json_is_detected():
+    assert ToolResultFormatter().detect_type('{"a": [1, 2]}') == ContentType.JSON
+
+
+def test_large_bracketed_text_is_not_reported_as_json():
+    formatter = ToolResultFormatter()
+    padding = "x" * 70_000
+    assert formatter.detect_type(f"[{padding}]") == ContentType.TEXT
+    assert formatter.detect_type(f"[OK] done\n\n[{padding}]") == ContentType.SUCCESS
+    assert formatter.detect_type(f"{{Error: {padding}}}") == ContentType.ERROR
@@ -0,0 +1,15 @@
+from adf_agent.history import CappedFileHistory
+
+
+def test_only_the_newest_entries_are_loaded(tmp_path, monkeypatch):
+    monkeypatch.setattr(CappedFileHistory, "MAX_ENTRIES", 3)
+    history = CappedFileHistory(str(tmp_path / "history"))
+    for i in range(5):
+        history.store_string(f"cmd {i}")
+
+    assert list(history.load_history_strings()) == ["cmd 4", "cmd 3", "cmd 2"]
+
+
+def test_missing_history_file_loads_nothing(tmp_path):
+    history = CappedFileHistory(str(tmp_path / "missing"))
+    assert list(history.load_history_strings()) == []
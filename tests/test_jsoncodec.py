@@ -0,0 +1,55 @@
+import datetime
+import json
+from dataclasses import dataclass
+
+import pytest
+
+from adf_agent import _jsoncodec
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_jsoncodec, "orjson", None)
+    return _jsoncodec
+
+
+class _Str(str):
+    pass
+
+
+@dataclass
+class _Point:
+    x: int
+
+
+@pytest.mark.parametrize("data", [
+    {"a": [1, 2.5, None, True], "b": "é"},
+    {1: "int key", None: "null key"},
+    {"big": 10 ** 30},
+    [_Str("subclass"), (1, 2)],
+])
+def test_dumps_indented_matches_stdlib(codec, data):
+    assert codec.dumps_indented(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("data", [datetime.datetime(2024, 1, 1), _Point(1), {"s": {1, 2}}])
+def test_unsupported_types_raise_like_stdlib(codec, data):
+    with pytest.raises(TypeError):
+        codec.dumps_indented(data)
+    with pytest.raises(TypeError):
+        codec.dumps(data)
+
+
+def test_dumps_default_matches_stdlib(codec):
+    data = {"at": datetime.datetime(2024, 1, 1, 12, 30), "n": 1}
+    expected = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+    assert codec.dumps(data, default=str) == expected.encode("utf-8")
+
+
+@pytest.mark.parametrize("text", ['{"a": [1, 2]}', "NaN", str(10 ** 30)])
+def test_loads_matches_stdlib(codec, text):
+    assert repr(codec.loads(text)) == repr(json.loads(text))
+    assert repr(codec.loads(text.encode("utf-8"))) == repr(json.loads(text))
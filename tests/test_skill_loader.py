@@ -0,0 +1,82 @@
+import os
+
+from adf_agent.skill_loader import SkillLoader
+
+
+def _write_skill(skill_dir, name: str, description: str, body: str, mtime_ns: int) -> None:
+    skill_dir.mkdir(exist_ok=True)
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text(f"---\nname: {name}\ndescription: {description}\n---\n{body}\n")
+    # Explicit mtimes, so edits are visible even on coarse-timestamp filesystems
+    os.utime(skill_md, ns=(mtime_ns, mtime_ns))
+
+
+def test_rename_in_frontmatter_is_picked_up_after_load(tmp_path):
+    skill_dir = tmp_path / "skill"
+    _write_skill(skill_dir, "alpha", "old", "old body", 1_000_000_000)
+    loader = SkillLoader([tmp_path])
+    assert loader.load_skill("alpha").instructions == "old body"
+
+    _write_skill(skill_dir, "beta", "new", "new body", 2_000_000_000)
+    assert loader.load_skill("alpha") is None
+    assert [(s.name, s.description) for s in loader.scan_skills()] == [("beta", "new")]
+    assert loader.load_skill("beta").instructions == "new body"
+
+
+def test_unchanged_skills_are_not_parsed_again(tmp_path, monkeypatch):
+    _write_skill(tmp_path / "a", "a", "desc", "body", 1_000_000_000)
+    loader = SkillLoader([tmp_path])
+    first = loader.scan_skills()
+
+    def fail(*args):
+        raise AssertionError("unchanged SKILL.md was re-parsed")
+
+    monkeypatch.setattr(loader, "_parse_skill_metadata", fail)
+    second = loader.scan_skills()
+    assert second == first
+    assert second is not first
+    assert loader.load_skill("a").instructions == "body"
+
+
+def test_skill_md_written_into_existing_dir_is_found(tmp_path):
+    (tmp_path / "late").mkdir()
+    loader = SkillLoader([tmp_path])
+    assert loader.scan_skills() == []
+
+    _write_skill(tmp_path / "late", "late", "desc", "body", 1_000_000_000)
+    # The base directory's mtime is unchanged by writing into a subdirectory
+    os.utime(tmp_path, ns=(1, 1))
+    assert [s.name for s in loader.scan_skills()] == ["late"]
+    assert loader.load_skill("late").instructions == "body"
+
+
+def test_edited_skill_is_picked_up_by_scan_and_load(tmp_path):
+    _write_skill(tmp_path / "a", "a", "old", "old body", 1_000_000_000)
+    loader = SkillLoader([tmp_path])
+    assert loader.load_skill("a").instructions == "old body"
+
+    _write_skill(tmp_path / "a", "a", "new", "new body", 2_000_000_000)
+    assert loader.load_skill("a").instructions == "new body"
+    assert [s.description for s in loader.scan_skills()] == ["new"]
+
+
+def test_removed_skill_is_no_longer_loaded(tmp_path):
+    _write_skill(tmp_path / "a", "a", "desc", "body", 1_000_000_000)
+    loader = SkillLoader([tmp_path])
+    assert loader.load_skill("a") is not None
+
+    (tmp_path / "a" / "SKILL.md").unlink()
+    assert loader.load_skill("a") is None
+    assert loader.scan_skills() == []
+
+
+def test_earlier_search_path_wins_on_duplicate_names(tmp_path):
+    project, user = tmp_path / "project", tmp_path / "user"
+    project.mkdir()
+    user.mkdir()
+    _write_skill(project / "a", "a", "project", "project body", 1_000_000_000)
+    _write_skill(user / "a", "a", "user", "user body", 1_000_000_000)
+    loader = SkillLoader([project, tmp_path / "missing", user])
+
+    assert [s.description for s in loader.scan_skills()] == ["project"]
+    assert loader.load_skill("a").instructions == "project body"